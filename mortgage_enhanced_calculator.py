@@ -6,17 +6,110 @@ Combines refinance analysis with real-time market data and expert forecasts
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
-import warnings
-warnings.filterwarnings('ignore')
+from dataclasses import dataclass, asdict, astuple
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import json
+import logging
+import os
+import time
 
 # Import our original calculator and market data scraper
 from mortgage_refinance_calculator import MortgageRefinanceCalculator, MortgageDetails, RefinanceOptions
 from mortgage_market_data import MortgageMarketDataScraper, RateData, MarketForecast
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Rate environment cut-offs (based on historical context): below 5.5% is low, below 7.5% is medium
+RATE_ENVIRONMENT_THRESHOLDS = np.array([0.055, 0.075])
+RATE_ENVIRONMENTS = np.array(['low', 'medium', 'high'])
+
+def classify_rate_environment(avg_rates):
+    """Classify one average rate, or an array of them, as 'low', 'medium' or 'high'"""
+    return RATE_ENVIRONMENTS[np.searchsorted(RATE_ENVIRONMENT_THRESHOLDS, avg_rates, side='right')]
+
+# Collected market data is reused in memory for this long before scraping again
+MARKET_DATA_TTL_SECONDS = 900
+# Snapshot of the last successful collection, reused by later runs for up to an hour
+MARKET_DATA_CACHE_DIR = '.cache'
+MARKET_SNAPSHOT_FILE = 'market_snapshot.json'
+MARKET_SNAPSHOT_MAX_AGE_SECONDS = 3600
+
+# Number of distinct (mortgage, scenarios) comparisons kept for reuse
+COMPARE_CACHE_SIZE = 8
+
+# Timing recommendations: (timing_rec, confidence, reasoning, 3-month outlook, 6-month outlook)
+_TIMING_LOW_RISING = (
+    'refi_now',
+    0.9,
+    'Rates are currently low and expected to rise. Excellent time to refinance.',
+    'Likely higher',
+    'Likely higher'
+)
+_TIMING_MEDIUM_RISING = (
+    'refi_now',
+    0.8,
+    'Rates are moderate but trending up. Good time to lock in current rates.',
+    'Likely higher',
+    'Likely higher'
+)
+_TIMING_HIGH_FALLING = (
+    'wait_6_months',
+    0.7,
+    'Rates are high but may decline. Consider waiting for better opportunities.',
+    'Possibly lower',
+    'Likely lower'
+)
+_TIMING_LOW_FALLING = (
+    'wait_3_months',
+    0.6,
+    'Rates are already low but may go lower. Short wait could be beneficial.',
+    'Possibly lower',
+    'Stable to lower'
+)
+_TIMING_STABLE = (
+    'refi_now',
+    0.7,
+    'Rates appear stable. If refinancing makes sense financially, proceed.',
+    'Stable',
+    'Stable'
+)
+_TIMING_DEFAULT = (
+    'uncertain',
+    0.5,
+    'Mixed market signals. Focus on personal financial benefits rather than timing.',
+    'Uncertain',
+    'Uncertain'
+)
+
+# Keyed on (rate_environment, forecast_consensus); anything missing falls back to _TIMING_DEFAULT
+_TIMING_TABLE: Dict[Tuple[str, str], Tuple[str, float, str, str, str]] = {
+    ('low', 'rates_rising'): _TIMING_LOW_RISING,
+    ('medium', 'rates_rising'): _TIMING_MEDIUM_RISING,
+    ('high', 'rates_falling'): _TIMING_HIGH_FALLING,
+    ('low', 'rates_falling'): _TIMING_LOW_FALLING,
+    ('low', 'rates_stable'): _TIMING_STABLE,
+    ('medium', 'rates_stable'): _TIMING_STABLE,
+    ('high', 'rates_stable'): _TIMING_STABLE,
+}
+
+# Market report templates
+_TIMING_SECTION = (
+    "\n🎯 MARKET TIMING ANALYSIS:\n"
+    "  • Rate Environment: {environment}\n"
+    "  • Expert Consensus: {consensus}\n"
+    "  • Timing Recommendation: {recommendation}\n"
+    "  • Confidence Level: {confidence:.0f}%\n"
+    "  • 3-Month Outlook: {outlook_3m}\n"
+    "  • 6-Month Outlook: {outlook_6m}"
+)
+_FORECAST_LINE = "  • {source}: {direction} ({timeframe})"
+_FORECAST_CONFIDENCE_LINE = "    Confidence: {confidence}"
+
+@dataclass(slots=True)
 class MarketTiming:
     """Market timing analysis results"""
     current_rate_environment: str  # 'low', 'medium', 'high'
@@ -35,42 +128,108 @@ class EnhancedMortgageCalculator:
         self.market_scraper = MortgageMarketDataScraper()
         self.market_data = None
         self.market_timing = None
+        self.market_cache_dir = MARKET_DATA_CACHE_DIR
+        self._market_data_ts = 0.0
+        self._average_rates = None
+        self._rates_np = np.empty(0, dtype=np.float64)
+        self._types_np = np.empty(0, dtype='U32')
+        self._rates_by_source = {}
+        self._compare_cache = OrderedDict()
     
-    def collect_market_data(self) -> Tuple[List[RateData], List[MarketForecast]]:
+    def collect_market_data(self, force_refresh: bool = False) -> Tuple[List[RateData], List[MarketForecast]]:
         """Collect current market data and forecasts"""
-        print("🌐 Collecting real-time market data...")
-        rates, forecasts = self.market_scraper.get_comprehensive_market_data()
+        # An empty scrape is not reused, so the next call tries the network again
+        if (not force_refresh and self.market_data and self.market_data.get('rates')
+                and time.time() - self._market_data_ts < MARKET_DATA_TTL_SECONDS):
+            return self.market_data['rates'], self.market_data['forecasts']
+        
+        logger.info("Collecting real-time market data...")
+        snapshot = None if force_refresh else self._load_market_snapshot()
+        if snapshot:
+            rates, forecasts = snapshot
+            self.market_scraper.rates_data = rates
+            self.market_scraper.forecasts_data = forecasts
+        else:
+            rates, forecasts = self.market_scraper.get_comprehensive_market_data(force_refresh=force_refresh)
+            self._save_market_snapshot(rates, forecasts)
         self.market_data = {'rates': rates, 'forecasts': forecasts}
+        self._market_data_ts = time.time()
+        
+        # Derived views are computed once per collection and reused by the analysis/report
+        self._average_rates = None
+        self._rates_np = np.array([r.rate for r in rates], dtype=np.float64)
+        self._types_np = np.array([r.rate_type.lower() for r in rates], dtype='U32')
+        self._rates_by_source = {}
+        for r in rates:
+            self._rates_by_source.setdefault(r.source, []).append(r)
         return rates, forecasts
     
+    def _market_snapshot_path(self) -> Optional[str]:
+        """Path of the single snapshot file, or None if snapshots are disabled"""
+        if not self.market_cache_dir:
+            return None
+        return os.path.join(self.market_cache_dir, MARKET_SNAPSHOT_FILE)
+    
+    def _load_market_snapshot(self) -> Optional[Tuple[List[RateData], List[MarketForecast]]]:
+        """Load the market data snapshot if one exists and is less than an hour old"""
+        path = self._market_snapshot_path()
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if time.time() - data['collected_at'] >= MARKET_SNAPSHOT_MAX_AGE_SECONDS:
+                return None
+            rates = [RateData(**r) for r in data['rates']]
+            forecasts = [MarketForecast(**fc) for fc in data['forecasts']]
+            return rates, forecasts
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _save_market_snapshot(self, rates: List[RateData], forecasts: List[MarketForecast]):
+        """Persist freshly scraped market data for reuse within the hour, replacing the previous snapshot"""
+        path = self._market_snapshot_path()
+        if not path or not rates:
+            return  # Don't pin a failed scrape for the rest of the hour
+        try:
+            os.makedirs(self.market_cache_dir, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'collected_at': time.time(),
+                    'rates': [asdict(r) for r in rates],
+                    'forecasts': [asdict(fc) for fc in forecasts]
+                }, f)
+        except OSError:
+            pass  # Caching is best-effort
+    
+    def get_average_rates(self) -> Dict[str, float]:
+        """Average market rates by loan type, cached until market data is re-collected"""
+        if self._average_rates is None:
+            self._average_rates = self.market_scraper.get_average_rates()
+        return self._average_rates
+    
     def analyze_market_timing(self) -> MarketTiming:
         """Analyze current market conditions for refinancing timing"""
         if not self.market_data:
             self.collect_market_data()
         
-        rates = self.market_data['rates']
         forecasts = self.market_data['forecasts']
         
         # Get current rate environment
-        current_30yr_rates = [r.rate for r in rates if '30-year' in r.rate_type.lower()]
-        avg_current_rate = np.mean(current_30yr_rates) if current_30yr_rates else 0.07
+        is_30yr = np.char.find(self._types_np, '30-year') >= 0
+        avg_current_rate = self._rates_np[is_30yr].mean() if is_30yr.any() else 0.07
         
         # Classify rate environment (based on historical context)
-        if avg_current_rate < 0.055:  # Below 5.5%
-            rate_environment = 'low'
-        elif avg_current_rate < 0.075:  # Below 7.5%
-            rate_environment = 'medium'
-        else:
-            rate_environment = 'high'
+        rate_environment = str(classify_rate_environment(avg_current_rate))
         
         # Analyze forecast consensus
-        forecast_directions = [f.direction for f in forecasts]
-        if not forecast_directions:
+        direction_votes = Counter(f.direction for f in forecasts)
+        if not direction_votes:
             forecast_consensus = 'uncertain'
         else:
-            up_votes = forecast_directions.count('up')
-            down_votes = forecast_directions.count('down')
-            stable_votes = forecast_directions.count('stable')
+            up_votes = direction_votes['up']
+            down_votes = direction_votes['down']
+            stable_votes = direction_votes['stable']
             
             if up_votes > down_votes + stable_votes:
                 forecast_consensus = 'rates_rising'
@@ -98,55 +257,7 @@ class EnhancedMortgageCalculator:
     
     def _generate_timing_recommendation(self, rate_env: str, forecast: str, current_rate: float) -> Tuple[str, float, str, str, str]:
         """Generate timing recommendation based on market analysis"""
-        
-        if rate_env == 'low' and forecast == 'rates_rising':
-            return (
-                'refi_now',
-                0.9,
-                'Rates are currently low and expected to rise. Excellent time to refinance.',
-                'Likely higher',
-                'Likely higher'
-            )
-        elif rate_env == 'medium' and forecast == 'rates_rising':
-            return (
-                'refi_now',
-                0.8,
-                'Rates are moderate but trending up. Good time to lock in current rates.',
-                'Likely higher',
-                'Likely higher'
-            )
-        elif rate_env == 'high' and forecast == 'rates_falling':
-            return (
-                'wait_6_months',
-                0.7,
-                'Rates are high but may decline. Consider waiting for better opportunities.',
-                'Possibly lower',
-                'Likely lower'
-            )
-        elif rate_env == 'low' and forecast == 'rates_falling':
-            return (
-                'wait_3_months',
-                0.6,
-                'Rates are already low but may go lower. Short wait could be beneficial.',
-                'Possibly lower',
-                'Stable to lower'
-            )
-        elif forecast == 'rates_stable':
-            return (
-                'refi_now',
-                0.7,
-                'Rates appear stable. If refinancing makes sense financially, proceed.',
-                'Stable',
-                'Stable'
-            )
-        else:
-            return (
-                'uncertain',
-                0.5,
-                'Mixed market signals. Focus on personal financial benefits rather than timing.',
-                'Uncertain',
-                'Uncertain'
-            )
+        return _TIMING_TABLE.get((rate_env, forecast), _TIMING_DEFAULT)
     
     def enhanced_refinance_analysis(self, current_mortgage: MortgageDetails, 
                                    scenarios: List[Tuple[str, RefinanceOptions]],
@@ -159,59 +270,87 @@ class EnhancedMortgageCalculator:
             market_timing = self.analyze_market_timing()
         
         # Run standard refinance analysis
-        results_df = self.calculator.compare_scenarios(current_mortgage, scenarios)
+        results_df = self._compare_scenarios_cached(current_mortgage, scenarios)
+        
+        # break_even_years mixes floats with 'Never'; keep a float copy for vectorized comparisons
+        break_even_years_num = pd.to_numeric(results_df['break_even_years'], errors='coerce').fillna(999).to_numpy()
         
         # Add market data if available
         if self.market_data and self.market_data['rates']:
-            avg_rates = self.market_scraper.get_average_rates()
+            avg_rates = self.get_average_rates()
             current_market_30yr = avg_rates.get('30-year', current_mortgage.rate)
             current_market_15yr = avg_rates.get('15-year', current_mortgage.rate * 0.85)
             
-            results_df['current_market_30yr'] = current_market_30yr * 100
-            results_df['current_market_15yr'] = current_market_15yr * 100
-            results_df['rate_vs_market_30yr'] = (results_df['effective_rate_after_buydown'] - current_market_30yr * 100)
+            market_30yr_pct = current_market_30yr * 100
+            results_df = results_df.assign(
+                current_market_30yr=market_30yr_pct,
+                current_market_15yr=current_market_15yr * 100,
+                rate_vs_market_30yr=results_df['effective_rate_after_buydown'] - market_30yr_pct
+            )
         
         # Add market timing analysis
         if self.market_timing:
-            results_df['market_timing_rec'] = self.market_timing.timing_recommendation
+            # Same label on every row, so store as single-category columns (int8 codes, no per-row strings)
+            codes = np.zeros(len(results_df), dtype=np.int8)
+            results_df['market_timing_rec'] = pd.Categorical.from_codes(
+                codes, categories=[self.market_timing.timing_recommendation])
             results_df['market_confidence'] = self.market_timing.confidence_score
-            results_df['rate_environment'] = self.market_timing.current_rate_environment
-            results_df['forecast_consensus'] = self.market_timing.forecast_consensus
+            results_df['rate_environment'] = pd.Categorical.from_codes(
+                codes, categories=[self.market_timing.current_rate_environment])
+            results_df['forecast_consensus'] = pd.Categorical.from_codes(
+                codes, categories=[self.market_timing.forecast_consensus])
             
             # Enhanced recommendations considering market timing
-            results_df['enhanced_recommendation'] = results_df.apply(
-                lambda row: self._combine_recommendations(
-                    row['recommendation'], 
-                    self.market_timing.timing_recommendation,
-                    row['break_even_years'] if isinstance(row['break_even_years'], (int, float)) else 999
-                ), axis=1
+            results_df['enhanced_recommendation'] = self._combine_recommendations_vectorized(
+                results_df['recommendation'],
+                self.market_timing.timing_recommendation,
+                break_even_years_num
             )
-        
+
         return results_df
     
-    def _combine_recommendations(self, financial_rec: str, timing_rec: str, break_even: float) -> str:
-        """Combine financial and timing recommendations"""
-        if 'NOT RECOMMENDED' in financial_rec:
-            return financial_rec + " + Market timing irrelevant"
+    def _compare_scenarios_cached(self, current_mortgage: MortgageDetails,
+                                  scenarios: List[Tuple[str, RefinanceOptions]]) -> pd.DataFrame:
+        """compare_scenarios, reusing the result when only the market layer has changed"""
+        key = (astuple(current_mortgage), tuple((name, astuple(opts)) for name, opts in scenarios))
+        cached = self._compare_cache.get(key)
+        if cached is not None:
+            self._compare_cache.move_to_end(key)
+            self.calculator.results = cached  # keep export_to_csv in sync with the returned frame
+            return cached.copy()
         
+        # compare_scenarios already returns a copy, so only the calculator's own frame is cached
+        results_df = self.calculator.compare_scenarios(current_mortgage, scenarios)
+        self._compare_cache[key] = self.calculator.results
+        if len(self._compare_cache) > COMPARE_CACHE_SIZE:
+            self._compare_cache.popitem(last=False)
+        return results_df
+    
+    def _combine_recommendations_vectorized(self, financial_recs: pd.Series, timing_rec: str,
+                                            break_even: np.ndarray) -> np.ndarray:
+        """Combine financial and timing recommendations for a whole results frame"""
+        recs = financial_recs.to_numpy(dtype=object)
+        not_recommended = financial_recs.str.contains('NOT RECOMMENDED', regex=False).to_numpy(dtype=bool)
+
+        # timing_rec is shared by every row, so branch on it once
         if timing_rec == 'refi_now':
-            if 'HIGHLY RECOMMENDED' in financial_rec:
-                return "🔥 EXCELLENT OPPORTUNITY - Great financials + Perfect timing"
-            else:
-                return "⭐ GOOD OPPORTUNITY - " + financial_rec + " + Good market timing"
+            highly = financial_recs.str.contains('HIGHLY RECOMMENDED', regex=False).to_numpy(dtype=bool)
+            combined = np.where(highly,
+                                "🔥 EXCELLENT OPPORTUNITY - Great financials + Perfect timing",
+                                "⭐ GOOD OPPORTUNITY - " + recs + " + Good market timing")
         elif timing_rec == 'wait_3_months':
-            if break_even <= 2:
-                return "⚡ REFI NOW - Benefits too good despite timing concerns"
-            else:
-                return "⏳ CONSIDER WAITING - " + financial_rec + " but rates may improve"
+            combined = np.where(break_even <= 2,
+                                "⚡ REFI NOW - Benefits too good despite timing concerns",
+                                "⏳ CONSIDER WAITING - " + recs + " but rates may improve")
         elif timing_rec == 'wait_6_months':
-            if break_even <= 1.5:
-                return "⚡ REFI NOW - Exceptional benefits outweigh timing"
-            else:
-                return "⏳ WAIT FOR BETTER RATES - Market conditions suggest patience"
+            combined = np.where(break_even <= 1.5,
+                                "⚡ REFI NOW - Exceptional benefits outweigh timing",
+                                "⏳ WAIT FOR BETTER RATES - Market conditions suggest patience")
         else:
-            return "🤔 MIXED SIGNALS - " + financial_rec + " but uncertain market"
-    
+            combined = "🤔 MIXED SIGNALS - " + recs + " but uncertain market"
+
+        return np.where(not_recommended, recs + " + Market timing irrelevant", combined)
+
     def generate_market_report(self) -> str:
         """Generate comprehensive market analysis report"""
         if not self.market_data or not self.market_timing:
@@ -228,62 +367,74 @@ class EnhancedMortgageCalculator:
         # Current rates section
         report.append(f"\n📊 CURRENT MARKET RATES:")
         if rates:
-            avg_rates = self.market_scraper.get_average_rates()
+            avg_rates = self.get_average_rates()
             for rate_type, rate in avg_rates.items():
                 report.append(f"  • {rate_type}: {rate*100:.3f}%")
             
             report.append(f"\n🏦 RATE SOURCES ({len(rates)} data points):")
-            sources = list(set([r.source for r in rates]))
-            for source in sources:
-                source_rates = [r for r in rates if r.source == source]
+            for source, source_rates in self._rates_by_source.items():
                 report.append(f"  • {source}: {len(source_rates)} rates")
         else:
             report.append("  No current rate data available")
         
         # Market timing analysis
-        report.append(f"\n🎯 MARKET TIMING ANALYSIS:")
-        report.append(f"  • Rate Environment: {timing.current_rate_environment.upper()}")
-        report.append(f"  • Expert Consensus: {timing.forecast_consensus.replace('_', ' ').title()}")
-        report.append(f"  • Timing Recommendation: {timing.timing_recommendation.replace('_', ' ').title()}")
-        report.append(f"  • Confidence Level: {timing.confidence_score*100:.0f}%")
-        report.append(f"  • 3-Month Outlook: {timing.rate_outlook_3_months}")
-        report.append(f"  • 6-Month Outlook: {timing.rate_outlook_6_months}")
+        report.append(_TIMING_SECTION.format(
+            environment=timing.current_rate_environment.upper(),
+            consensus=timing.forecast_consensus.replace('_', ' ').title(),
+            recommendation=timing.timing_recommendation.replace('_', ' ').title(),
+            confidence=timing.confidence_score * 100,
+            outlook_3m=timing.rate_outlook_3_months,
+            outlook_6m=timing.rate_outlook_6_months
+        ))
         
         # Expert forecasts
         report.append(f"\n🔮 EXPERT FORECASTS ({len(forecasts)} sources):")
+        forecast_line = _FORECAST_LINE.format
+        confidence_line = _FORECAST_CONFIDENCE_LINE.format
         for forecast in forecasts:
-            report.append(f"  • {forecast.source}: {forecast.direction.upper()} ({forecast.timeframe.replace('_', ' ')})")
+            report.append(forecast_line(
+                source=forecast.source,
+                direction=forecast.direction.upper(),
+                timeframe=forecast.timeframe.replace('_', ' ')
+            ))
             if forecast.confidence:
-                report.append(f"    Confidence: {forecast.confidence}")
+                report.append(confidence_line(confidence=forecast.confidence))
         
         # Market reasoning
-        report.append(f"\n💡 MARKET REASONING:")
-        report.append(f"  {timing.reasoning}")
+        report.append(f"\n💡 MARKET REASONING:\n  {timing.reasoning}")
         
         return "\n".join(report)
     
-    def export_enhanced_analysis(self, filename: str = None) -> str:
+    def _write_summary(self, filename: str) -> str:
+        """Write the market report to a text file"""
+        Path(filename).write_text(self.generate_market_report(), encoding='utf-8')
+        return filename
+    
+    def export_enhanced_analysis(self, filename: str = None) -> Tuple[str, str, str]:
         """Export enhanced analysis with market data"""
         if filename is None:
             filename = f"enhanced_mortgage_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         
-        # Export main analysis
-        main_filename = self.calculator.export_to_csv(filename)
+        base = Path(filename)
+        market_filename = str(base.with_name(base.stem + '_market_data.csv'))
+        summary_filename = str(base.with_name(base.stem + '_summary.txt'))
         
-        # Export market data
-        market_filename = self.market_scraper.export_market_data(
-            filename.replace('.csv', '_market_data.csv')
-        )
-        
-        # Create summary file
-        summary_filename = filename.replace('.csv', '_summary.txt')
-        with open(summary_filename, 'w', encoding='utf-8') as f:
-            f.write(self.generate_market_report())
-        
-        return main_filename, market_filename, summary_filename
+        # The three files are independent, so write them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Export main analysis
+            main_future = executor.submit(self.calculator.export_to_csv, filename)
+            
+            # Export market data
+            market_future = executor.submit(self.market_scraper.export_market_data, market_filename)
+            
+            # Create summary file
+            summary_future = executor.submit(self._write_summary, summary_filename)
+            
+            return main_future.result(), market_future.result(), summary_future.result()
 
 def main():
     """Example usage of enhanced mortgage calculator"""
+    logging.basicConfig(level=logging.INFO)
     
     print("🏠 ENHANCED MORTGAGE REFINANCE CALCULATOR WITH MARKET DATA")
     print("=" * 70)
@@ -326,21 +477,19 @@ def main():
     
     # Display enhanced recommendations
     print(f"\n🎯 ENHANCED REFINANCE RECOMMENDATIONS:")
-    for _, row in results_df.iterrows():
-        print(f"\n📊 {row['custom_scenario_name']}")
-        if 'enhanced_recommendation' in row:
-            print(f"   {row['enhanced_recommendation']}")
-        else:
-            print(f"   {row['recommendation']}")
-        
-        if 'rate_vs_market_30yr' in row:
-            market_diff = row['rate_vs_market_30yr']
-            if abs(market_diff) < 0.01:
-                market_note = "At market rate"
-            elif market_diff > 0:
-                market_note = f"{market_diff:.3f}% above market"
-            else:
-                market_note = f"{abs(market_diff):.3f}% below market"
+    rec_col = 'enhanced_recommendation' if 'enhanced_recommendation' in results_df else 'recommendation'
+    if 'rate_vs_market_30yr' in results_df:
+        market_diff = results_df['rate_vs_market_30yr'].to_numpy(dtype=float)
+        diff_text = pd.Series(np.abs(market_diff)).map('{:.3f}'.format).to_numpy(dtype=object)
+        market_notes = np.where(np.abs(market_diff) < 0.01, "At market rate",
+                                diff_text + np.where(market_diff > 0, "% above market", "% below market"))
+    else:
+        market_notes = [None] * len(results_df)
+    
+    for name, rec, market_note in zip(results_df['custom_scenario_name'], results_df[rec_col], market_notes):
+        print(f"\n📊 {name}")
+        print(f"   {rec}")
+        if market_note is not None:
             print(f"   Market Comparison: {market_note}")
     
     # Export results
@@ -5,11 +5,12 @@ User-friendly graphical interface with market data integration
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-import pandas as pd
-from datetime import datetime, date
+from tkinter import ttk, messagebox
+import numpy as np
+import csv
+from datetime import datetime
 import threading
-import os
+import queue
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.ticker as ticker
@@ -21,9 +22,69 @@ try:
 except ImportError:
     HAS_CALENDAR = False
 
-# Import our enhanced calculator
-from mortgage_enhanced_calculator import EnhancedMortgageCalculator
-from mortgage_refinance_calculator import MortgageDetails, RefinanceOptions, RecastOptions
+# pandas and the calculator modules are imported on first use to keep GUI startup fast
+
+# Array dtype for each per-scenario form field
+SCENARIO_FIELD_DTYPES = {
+    'enabled': bool,
+    'name': object,
+    'rate': float,
+    'term_years': int,
+    'closing_costs': float,
+    'use_points': bool,
+    'points': float,
+    'point_reduction': float,
+    'extra_monthly': float,
+    'extra_one_time': float
+}
+
+# Buydown fields, only read for scenarios with use_points set
+POINTS_FIELDS = ('points', 'point_reduction')
+
+# Result columns shown as dollar amounts in the results tab
+CURRENCY_DISPLAY_COLUMNS = [
+    'new_monthly_payment', 'monthly_savings', 'total_upfront_cost', 'buydown_cost',
+    'savings_5_years', 'lump_sum_payment', 'recast_fee', 'interest_savings_full_term'
+]
+
+# Static help shown by the Help button
+HELP_TEXT = """
+🏠 ENHANCED MORTGAGE REFINANCE CALCULATOR HELP
+
+This calculator helps you determine if refinancing your mortgage makes financial sense by:
+
+📊 TABS:
+• Current Mortgage: Enter your existing loan details
+• Refinance Scenarios: Set up different refi options to compare  
+• Analysis Options: Choose market data and export settings
+• Results: View detailed analysis and recommendations
+
+💰 KEY FEATURES:
+• Break-even analysis - when you recover closing costs
+• Multiple scenario comparison
+• Buydown points analysis 
+• Real-time market data integration
+• Expert forecast recommendations
+
+🌐 MARKET DATA:
+When enabled, scrapes current rates from:
+• Freddie Mac PMMS
+• Bankrate  
+• Mortgage News Daily
+Plus expert forecasts for timing recommendations.
+
+🎯 BUYDOWN POINTS:
+Check "Buy down with points" to analyze paying upfront to reduce your rate.
+Typical: 1 point = 1% of loan amount, reduces rate by 0.25%
+
+📄 EXPORT:
+Results are saved as CSV files you can open in Excel for detailed analysis.
+
+💡 TIPS:
+• Use realistic rates from actual lender quotes
+• Consider how long you'll stay in the home
+• Factor in your risk tolerance and financial goals
+"""
 
 class MortgageGUI:
     """GUI interface for mortgage refinance calculator"""
@@ -34,10 +95,18 @@ class MortgageGUI:
         self.root.geometry("900x700")
         self.root.resizable(True, True)
         
-        # Calculator instance
-        self.calculator = EnhancedMortgageCalculator()
+        # Calculator instance, created on the first analysis run
+        self.calculator = None
+        
+        # Analysis runs on a daemon thread (so a slow market scrape never keeps the app alive)
+        # and hands its outcome back through a queue polled from the Tk loop
+        self._analysis_thread = None
+        self._analysis_queue = queue.Queue()
         self.results_df = None
         
+        # Help window, built on first use and hidden rather than destroyed on close
+        self._help_window = None
+        
         # Variables for form inputs
         self.current_rate = tk.DoubleVar(value=6.75)
         self.current_balance = tk.DoubleVar(value=450000)
@@ -45,6 +114,8 @@ class MortgageGUI:
         # Default to 25 years from today
         default_maturity = datetime.now().date().replace(year=datetime.now().year + 25)
         self.maturity_date = tk.StringVar(value=default_maturity.strftime("%Y-%m-%d"))
+        self._cached_maturity = None
+        self.maturity_date.trace_add('write', self._invalidate_maturity)
         
         self.current_extra_monthly = tk.DoubleVar(value=0.0)
         self.current_extra_one_time = tk.DoubleVar(value=0.0)
@@ -84,10 +155,16 @@ class MortgageGUI:
         if HAS_CALENDAR and hasattr(self, 'maturity_date_picker'):
             self.maturity_date.set(self.maturity_date_picker.get_date().strftime("%Y-%m-%d"))
     
+    def _invalidate_maturity(self, *args):
+        """Drop the parsed maturity date when the maturity field changes"""
+        self._cached_maturity = None
+    
     def get_remaining_months(self):
         """Calculate remaining months from maturity date"""
         try:
-            maturity = datetime.strptime(self.maturity_date.get(), "%Y-%m-%d").date()
+            if self._cached_maturity is None:
+                self._cached_maturity = datetime.strptime(self.maturity_date.get(), "%Y-%m-%d").date()
+            maturity = self._cached_maturity
             today = datetime.now().date()
             
             if maturity <= today:
@@ -111,35 +188,18 @@ class MortgageGUI:
         notebook = ttk.Notebook(self.root)
         notebook.pack(fill='both', expand=True, padx=10, pady=10)
         
-        # Tab 1: Current Mortgage
-        current_frame = ttk.Frame(notebook)
-        notebook.add(current_frame, text="Current Mortgage")
-        self.create_current_mortgage_tab(current_frame)
-        
-        # Tab 2: Refinance Scenarios
-        scenarios_frame = ttk.Frame(notebook)
-        notebook.add(scenarios_frame, text="Refinance Scenarios")
-        self.create_scenarios_tab(scenarios_frame)
-        
-        # Tab 2.5: Recast Options
-        recast_frame = ttk.Frame(notebook)
-        notebook.add(recast_frame, text="Recast Options")
-        self.create_recast_tab(recast_frame)
-        
-        # Tab 3: Analysis Options
-        options_frame = ttk.Frame(notebook)
-        notebook.add(options_frame, text="Analysis Options")
-        self.create_options_tab(options_frame)
-        
-        # Tab 4: Results
-        results_frame = ttk.Frame(notebook)
-        notebook.add(results_frame, text="Results")
-        self.create_results_tab(results_frame)
-        
-        # Tab 5: Visualizations
-        viz_frame = ttk.Frame(notebook)
-        notebook.add(viz_frame, text="Visualizations")
-        self.create_viz_tab(viz_frame)
+        tabs = [
+            ("Current Mortgage", self.create_current_mortgage_tab),
+            ("Refinance Scenarios", self.create_scenarios_tab),
+            ("Recast Options", self.create_recast_tab),
+            ("Analysis Options", self.create_options_tab),
+            ("Results", self.create_results_tab),
+            ("Visualizations", self.create_viz_tab)
+        ]
+        for text, create_tab in tabs:
+            tab_frame = ttk.Frame(notebook)
+            notebook.add(tab_frame, text=text)
+            create_tab(tab_frame)
         
         # Bottom frame for main buttons
         button_frame = ttk.Frame(self.root)
@@ -154,6 +214,15 @@ class MortgageGUI:
         ttk.Button(button_frame, text="❓ Help", 
                   command=self.show_help).pack(side='right', padx=5)
     
+    def create_entry_rows(self, parent, specs, row_padx=0, entry_pack=None):
+        """Create a labelled entry row for each (label, variable, width) spec"""
+        entry_pack = entry_pack or {'side': 'right'}
+        for label, variable, width in specs:
+            row_frame = ttk.Frame(parent)
+            row_frame.pack(fill='x', padx=row_padx, pady=5)
+            ttk.Label(row_frame, text=label).pack(side='left', anchor='w')
+            ttk.Entry(row_frame, textvariable=variable, width=width).pack(**entry_pack)
+    
     def create_current_mortgage_tab(self, parent):
         """Create current mortgage input tab"""
         main_frame = ttk.Frame(parent)
@@ -166,26 +235,11 @@ class MortgageGUI:
         form_frame = ttk.Frame(main_frame)
         form_frame.pack(fill='x')
         
-        # Interest Rate
-        rate_frame = ttk.Frame(form_frame)
-        rate_frame.pack(fill='x', pady=5)
-        ttk.Label(rate_frame, text="💰 Current Interest Rate (%):").pack(side='left', anchor='w')
-        rate_entry = ttk.Entry(rate_frame, textvariable=self.current_rate, width=15)
-        rate_entry.pack(side='right')
-        
-        # Balance
-        balance_frame = ttk.Frame(form_frame)
-        balance_frame.pack(fill='x', pady=5)
-        ttk.Label(balance_frame, text="💵 Outstanding Balance ($):").pack(side='left', anchor='w')
-        balance_entry = ttk.Entry(balance_frame, textvariable=self.current_balance, width=15)
-        balance_entry.pack(side='right')
-        
-        # Payment
-        payment_frame = ttk.Frame(form_frame)
-        payment_frame.pack(fill='x', pady=5)
-        ttk.Label(payment_frame, text="📅 Monthly Payment - P&I only ($):").pack(side='left', anchor='w')
-        payment_entry = ttk.Entry(payment_frame, textvariable=self.current_payment, width=15)
-        payment_entry.pack(side='right')
+        self.create_entry_rows(form_frame, [
+            ("💰 Current Interest Rate (%):", self.current_rate, 15),
+            ("💵 Outstanding Balance ($):", self.current_balance, 15),
+            ("📅 Monthly Payment - P&I only ($):", self.current_payment, 15)
+        ])
         
         # Maturity Date
         maturity_frame = ttk.Frame(form_frame)
@@ -313,15 +367,10 @@ class MortgageGUI:
         ttk.Checkbutton(form_frame, text="Include Recast Scenario", 
                        variable=self.recast_enabled).pack(anchor='w', padx=10, pady=10)
         
-        lump_frame = ttk.Frame(form_frame)
-        lump_frame.pack(fill='x', padx=10, pady=5)
-        ttk.Label(lump_frame, text="Lump Sum Payment ($):").pack(side='left', anchor='w')
-        ttk.Entry(lump_frame, textvariable=self.recast_lump_sum, width=15).pack(side='left', padx=10)
-        
-        fee_frame = ttk.Frame(form_frame)
-        fee_frame.pack(fill='x', padx=10, pady=5)
-        ttk.Label(fee_frame, text="Recast Fee ($):").pack(side='left', anchor='w')
-        ttk.Entry(fee_frame, textvariable=self.recast_fee, width=15).pack(side='left', padx=10)
+        self.create_entry_rows(form_frame, [
+            ("Lump Sum Payment ($):", self.recast_lump_sum, 15),
+            ("Recast Fee ($):", self.recast_fee, 15)
+        ], row_padx=10, entry_pack={'side': 'left', 'padx': 10})
         
         extra_frame = ttk.Frame(form_frame)
         extra_frame.pack(fill='x', padx=10, pady=5)
@@ -376,9 +425,20 @@ class MortgageGUI:
         results_scrollbar.pack(side="right", fill="y")
         
         # Initial message
-        self.results_text.insert(tk.END, "📊 Results will appear here after running the analysis...\n\n")
-        self.results_text.insert(tk.END, "💡 Click 'Run Analysis' to get started!")
-        self.results_text.config(state=tk.DISABLED)
+        self.results_text.insert(tk.END, "📊 Results will appear here after running the analysis...\n\n"
+                                         "💡 Click 'Run Analysis' to get started!")
+        
+        # Read-only by swallowing edits, so updates need no state toggling
+        self.results_text.bind('<Key>', self.block_results_edit)
+        for sequence in ('<<Cut>>', '<<Paste>>', '<<PasteSelection>>'):
+            self.results_text.bind(sequence, lambda event: 'break')
+    
+    def block_results_edit(self, event):
+        """Ignore key presses in the results view except copy and select-all"""
+        # Control (0x4), or Command on macOS, which Tk reports as Mod1 (0x8)
+        if event.state & (0x4 | 0x8) and event.keysym.lower() in ('c', 'a'):
+            return None
+        return 'break'
         
     def create_viz_tab(self, parent):
         """Create visual charts tab"""
@@ -397,155 +457,227 @@ class MortgageGUI:
     def run_analysis(self):
         """Run the mortgage refinance analysis"""
         try:
+            # Ignore repeated clicks while an analysis is still running
+            if self._analysis_thread is not None and self._analysis_thread.is_alive():
+                return
+            
             # Validate inputs
             if not self.validate_inputs():
                 return
             
+            from mortgage_enhanced_calculator import EnhancedMortgageCalculator
+            from mortgage_refinance_calculator import MortgageDetails, RefinanceOptions, RecastOptions
+            if self.calculator is None:
+                self.calculator = EnhancedMortgageCalculator()
+            
             # Update UI to show analysis is running
-            self.results_text.config(state=tk.NORMAL)
             self.results_text.delete(1.0, tk.END)
-            self.results_text.insert(tk.END, "🔄 Running analysis...\n\n")
+            status = "🔄 Running analysis...\n\n"
             if self.include_market_data.get():
-                self.results_text.insert(tk.END, "🌐 Collecting market data (this may take 30-60 seconds)...\n")
-            self.results_text.config(state=tk.DISABLED)
+                status += "🌐 Collecting market data (this may take 30-60 seconds)...\n"
+            self.results_text.insert(tk.END, status)
             self.root.update()
             
-            # Run analysis in a thread to prevent GUI freezing
-            def analysis_thread():
-                try:
-                    # Create mortgage details
-                    current_mortgage = MortgageDetails(
-                        rate=self.current_rate.get() / 100,
-                        balance=self.current_balance.get(),
-                        payment=self.current_payment.get(),
-                        remaining_months=self.get_remaining_months(),
-                        extra_monthly_payment=self.current_extra_monthly.get(),
-                        extra_one_time_payment=self.current_extra_one_time.get()
-                    )
-                    
-                    # Create scenarios
-                    scenarios = []
-                    for i, scenario_vars in enumerate(self.scenario_vars):
-                        if scenario_vars['enabled'].get():
-                            buydown_points = scenario_vars['points'].get() if scenario_vars['use_points'].get() else 0.0
-                            rate_reduction = scenario_vars['point_reduction'].get() / 100 if scenario_vars['use_points'].get() else 0.0025
-                            
-                            refi_option = RefinanceOptions(
-                                new_rate=scenario_vars['rate'].get() / 100,
-                                new_term_months=scenario_vars['term_years'].get() * 12,
-                                closing_costs=scenario_vars['closing_costs'].get(),
-                                buydown_points=buydown_points,
-                                rate_reduction_per_point=rate_reduction,
-                                extra_monthly_payment=scenario_vars['extra_monthly'].get(),
-                                extra_one_time_payment=scenario_vars['extra_one_time'].get()
-                            )
-                            
-                            scenarios.append((scenario_vars['name'].get(), refi_option))
-                    
-                    # Run enhanced analysis
-                    if scenarios:
-                        self.results_df = self.calculator.enhanced_refinance_analysis(
-                            current_mortgage, 
-                            scenarios, 
-                            include_market_rates=self.include_market_data.get()
-                        )
-                    else:
-                        self.results_df = pd.DataFrame()
-                        
-                    # Add Recast Scenario
-                    if self.recast_enabled.get():
-                        recast_opts = RecastOptions(
-                            lump_sum_payment=self.recast_lump_sum.get(),
-                            recast_fee=self.recast_fee.get(),
-                            extra_monthly_payment=self.recast_extra_monthly.get(),
-                            extra_one_time_payment=self.recast_extra_one_time.get()
-                        )
-                        recast_res = self.calculator.calculator.analyze_recast(current_mortgage, recast_opts)
-                        recast_res['custom_scenario_name'] = "Recast Scenario"
-                        recast_df = pd.DataFrame([recast_res])
-                        if self.results_df.empty:
-                            self.results_df = recast_df
-                        else:
-                            self.results_df = pd.concat([self.results_df, recast_df], ignore_index=True)
-                    
-                    # Update UI with results
-                    self.root.after(0, self.display_results)
-                    
-                except Exception as e:
-                    self.root.after(0, lambda: self.show_error(f"Analysis error: {str(e)}"))
-            
-            # Start analysis thread
-            thread = threading.Thread(target=analysis_thread)
-            thread.daemon = True
-            thread.start()
+            # Snapshot every Tk variable here on the main thread; the worker must not touch them
+            current_mortgage = MortgageDetails(
+                rate=self.current_rate.get() / 100,
+                balance=self.current_balance.get(),
+                payment=self.current_payment.get(),
+                remaining_months=self.get_remaining_months(),
+                extra_monthly_payment=self.current_extra_monthly.get(),
+                extra_one_time_payment=self.current_extra_one_time.get()
+            )
+            
+            # Create scenarios from the snapshot, which only holds enabled entries
+            active = self._snapshot_scenarios()
+            buydown_points = np.where(active['use_points'], active['points'], 0.0)
+            rate_reduction = np.where(active['use_points'], active['point_reduction'] / 100, 0.0025)
+            
+            scenarios = [
+                (name, RefinanceOptions(
+                    new_rate=new_rate,
+                    new_term_months=new_term_months,
+                    closing_costs=closing_costs,
+                    buydown_points=points,
+                    rate_reduction_per_point=reduction,
+                    extra_monthly_payment=extra_monthly,
+                    extra_one_time_payment=extra_one_time
+                ))
+                for name, new_rate, new_term_months, closing_costs, points, reduction, extra_monthly, extra_one_time in zip(
+                    active['name'].tolist(),
+                    (active['rate'] / 100).tolist(),
+                    (active['term_years'] * 12).tolist(),
+                    active['closing_costs'].tolist(),
+                    buydown_points.tolist(),
+                    rate_reduction.tolist(),
+                    active['extra_monthly'].tolist(),
+                    active['extra_one_time'].tolist()
+                )
+            ]
+            
+            include_market = self.include_market_data.get()
+            recast_opts = None
+            if self.recast_enabled.get():
+                recast_opts = RecastOptions(
+                    lump_sum_payment=self.recast_lump_sum.get(),
+                    recast_fee=self.recast_fee.get(),
+                    extra_monthly_payment=self.recast_extra_monthly.get(),
+                    extra_one_time_payment=self.recast_extra_one_time.get()
+                )
+            
+            # Run analysis on the worker thread to prevent GUI freezing; poll for the result
+            self._analysis_thread = threading.Thread(
+                target=self._run_analysis_worker,
+                args=(current_mortgage, scenarios, include_market, recast_opts),
+                daemon=True
+            )
+            self._analysis_thread.start()
+            self.root.after(100, self._poll_analysis)
             
         except Exception as e:
             self.show_error(f"Error starting analysis: {str(e)}")
     
+    def _run_analysis_worker(self, *job_args):
+        """Thread target: run the analysis and queue either its results or the error raised"""
+        try:
+            self._analysis_queue.put((self._run_analysis_job(*job_args), None))
+        except Exception as e:
+            self._analysis_queue.put((None, e))
+    
+    def _run_analysis_job(self, current_mortgage, scenarios, include_market, recast_opts):
+        """Run the calculator on the worker thread and return the results DataFrame"""
+        import pandas as pd
+        
+        # Run enhanced analysis
+        if scenarios:
+            results_df = self.calculator.enhanced_refinance_analysis(
+                current_mortgage, 
+                scenarios, 
+                include_market_rates=include_market
+            )
+        else:
+            results_df = pd.DataFrame()
+            
+        # Add Recast Scenario
+        if recast_opts is not None:
+            recast_res = self.calculator.calculator.analyze_recast(current_mortgage, recast_opts)
+            recast_res['custom_scenario_name'] = "Recast Scenario"
+            recast_df = pd.DataFrame([recast_res])
+            if results_df.empty:
+                results_df = recast_df
+            else:
+                results_df = pd.concat([results_df, recast_df], ignore_index=True)
+        
+        return results_df
+    
+    def _poll_analysis(self):
+        """Check the running analysis from the Tk event loop and show its outcome"""
+        try:
+            results_df, error = self._analysis_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(100, self._poll_analysis)
+            return
+        
+        if error is not None:
+            self.show_error(f"Analysis error: {str(error)}")
+            return
+        
+        self.results_df = results_df
+        self.display_results()
+    
+    def _snapshot_scenarios(self):
+        """Read the enabled scenarios' variables once into parallel NumPy arrays keyed by field"""
+        # Disabled scenarios are never read, so a blank field in one cannot block the analysis
+        enabled = [sv for sv in self.scenario_vars if sv['enabled'].get()]
+        snapshot = {
+            key: np.array([sv[key].get() for sv in enabled], dtype=dtype)
+            for key, dtype in SCENARIO_FIELD_DTYPES.items() if key not in POINTS_FIELDS
+        }
+        
+        # Points fields are left unread when use_points is off; run_analysis masks those rows out anyway
+        use_points = snapshot['use_points'].tolist()
+        for key in POINTS_FIELDS:
+            snapshot[key] = np.array(
+                [sv[key].get() if used else 0.0 for sv, used in zip(enabled, use_points)],
+                dtype=SCENARIO_FIELD_DTYPES[key]
+            )
+        return snapshot
+    
     def display_results(self):
         """Display analysis results in the results tab"""
-        self.results_text.config(state=tk.NORMAL)
+        import pandas as pd
+        
         self.results_text.delete(1.0, tk.END)
         
         self.plot_amortization_graphs()
         
+        # Build the whole report first and hand it to the widget in one insert
+        parts = []
+        
         # Market analysis (if available)
         if hasattr(self.calculator, 'market_timing') and self.calculator.market_timing:
             market_report = self.calculator.generate_market_report()
-            self.results_text.insert(tk.END, market_report + "\n\n")
-            self.results_text.insert(tk.END, "="*80 + "\n\n")
+            parts.append(market_report + "\n\n")
+            parts.append("="*80 + "\n\n")
         
         # Scenario results
-        self.results_text.insert(tk.END, "📊 REFINANCE SCENARIO RESULTS\n")
-        self.results_text.insert(tk.END, "="*50 + "\n\n")
+        parts.append("📊 REFINANCE SCENARIO RESULTS\n")
+        parts.append("="*50 + "\n\n")
+        
+        # Format the currency columns once per column rather than once per line
+        display_df = self.results_df.assign(**{
+            col: self.results_df[col].map('${:,.2f}'.format)
+            for col in CURRENCY_DISPLAY_COLUMNS if col in self.results_df.columns
+        })
         
-        for i, (_, row) in enumerate(self.results_df.iterrows(), 1):
-            self.results_text.insert(tk.END, f"{i}. 📋 {row['custom_scenario_name']}\n")
-            self.results_text.insert(tk.END, "   " + "-"*40 + "\n")
+        has_enhanced = 'enhanced_recommendation' in display_df.columns
+        for i, row in enumerate(display_df.itertuples(index=False), 1):
+            parts.append(f"{i}. 📋 {row.custom_scenario_name}\n")
+            parts.append("   " + "-"*40 + "\n")
             
             # Format differences for Recast vs Refi
-            if "Recast" in row['custom_scenario_name']:
-                self.results_text.insert(tk.END, f"   💰 New Monthly Payment: ${row['new_monthly_payment']:,.2f}\n")
-                self.results_text.insert(tk.END, f"   📉 Monthly Payment Drop: ${row['monthly_savings']:,.2f}\n")
-                self.results_text.insert(tk.END, f"   💸 Lump Sum Payment: ${row['lump_sum_payment']:,.2f}\n")
-                self.results_text.insert(tk.END, f"   💳 Recast Fee: ${row['recast_fee']:,.2f}\n")
-                self.results_text.insert(tk.END, f"   📉 Total Interest Saved: ${row['interest_savings_full_term']:,.2f}\n")
+            if "Recast" in row.custom_scenario_name:
+                parts.append(f"   💰 New Monthly Payment: {row.new_monthly_payment}\n")
+                parts.append(f"   📉 Monthly Payment Drop: {row.monthly_savings}\n")
+                parts.append(f"   💸 Lump Sum Payment: {row.lump_sum_payment}\n")
+                parts.append(f"   💳 Recast Fee: {row.recast_fee}\n")
+                parts.append(f"   📉 Total Interest Saved: {row.interest_savings_full_term}\n")
             else:
-                self.results_text.insert(tk.END, f"   💰 New Monthly Payment: ${row['new_monthly_payment']:,.2f}\n")
-                self.results_text.insert(tk.END, f"   📉 Monthly Savings: ${row['monthly_savings']:,.2f}\n")
-                self.results_text.insert(tk.END, f"   💸 Total Upfront Costs: ${row['total_upfront_cost']:,.2f}\n")
+                parts.append(f"   💰 New Monthly Payment: {row.new_monthly_payment}\n")
+                parts.append(f"   📉 Monthly Savings: {row.monthly_savings}\n")
+                parts.append(f"   💸 Total Upfront Costs: {row.total_upfront_cost}\n")
 
             
-            if row['buydown_points'] > 0:
-                self.results_text.insert(tk.END, f"   🎯 Buydown Points: {row['buydown_points']} (${row['buydown_cost']:,.2f})\n")
-                self.results_text.insert(tk.END, f"   📊 Effective Rate: {row['effective_rate_after_buydown']:.3f}%\n")
+            if row.buydown_points > 0:
+                parts.append(f"   🎯 Buydown Points: {row.buydown_points} ({row.buydown_cost})\n")
+                parts.append(f"   📊 Effective Rate: {row.effective_rate_after_buydown:.3f}%\n")
             else:
-                self.results_text.insert(tk.END, f"   📊 Interest Rate: {row['effective_rate_after_buydown']:.3f}%\n")
+                parts.append(f"   📊 Interest Rate: {row.effective_rate_after_buydown:.3f}%\n")
             
-            if isinstance(row['break_even_years'], (int, float)) and row['break_even_years'] != float('inf'):
-                self.results_text.insert(tk.END, f"   ⚖️  Break-Even Time: {row['break_even_years']:.1f} years\n")
+            if isinstance(row.break_even_years, (int, float)) and row.break_even_years != float('inf'):
+                parts.append(f"   ⚖️  Break-Even Time: {row.break_even_years:.1f} years\n")
             else:
-                self.results_text.insert(tk.END, f"   ⚖️  Break-Even Time: Never\n")
+                parts.append(f"   ⚖️  Break-Even Time: Never\n")
             
-            self.results_text.insert(tk.END, f"   💵 5-Year Net Savings: ${row['savings_5_years']:,.2f}\n")
+            parts.append(f"   💵 5-Year Net Savings: {row.savings_5_years}\n")
             
-            if 'enhanced_recommendation' in row and pd.notnull(row['enhanced_recommendation']):
-                self.results_text.insert(tk.END, f"   🏆 Recommendation: {row['enhanced_recommendation']}\n")
+            if has_enhanced and pd.notnull(row.enhanced_recommendation):
+                parts.append(f"   🏆 Recommendation: {row.enhanced_recommendation}\n")
             else:
-                self.results_text.insert(tk.END, f"   🏆 Recommendation: {row['recommendation']}\n")
+                parts.append(f"   🏆 Recommendation: {row.recommendation}\n")
             
-            self.results_text.insert(tk.END, "\n")
+            parts.append("\n")
         
         # Summary
-        best_5yr = self.results_df.loc[self.results_df['savings_5_years'].idxmax()]
-        self.results_text.insert(tk.END, f"🏆 BEST 5-YEAR VALUE: {best_5yr['custom_scenario_name']}\n")
-        self.results_text.insert(tk.END, f"   Net 5-year savings: ${best_5yr['savings_5_years']:,.2f}\n\n")
+        best_5yr = self.results_df.nlargest(1, 'savings_5_years').iloc[0]
+        parts.append(f"🏆 BEST 5-YEAR VALUE: {best_5yr['custom_scenario_name']}\n")
+        parts.append(f"   Net 5-year savings: ${best_5yr['savings_5_years']:,.2f}\n\n")
         
-        self.results_text.insert(tk.END, "✅ Analysis complete!\n")
+        parts.append("✅ Analysis complete!\n")
         if self.export_results.get():
-            self.results_text.insert(tk.END, "📄 Results exported to CSV files.\n")
+            parts.append("📄 Results exported to CSV files.\n")
         
-        self.results_text.config(state=tk.DISABLED)
+        self.results_text.insert(tk.END, ''.join(parts))
         
         # Auto-export if enabled
         if self.export_results.get():
@@ -562,21 +694,17 @@ class MortgageGUI:
             first_row = self.results_df.iloc[0]
             if 'schedule_current' in first_row:
                 curr_sched = first_row['schedule_current']
-                if curr_sched:
-                    x_curr = [item['month']/12.0 for item in curr_sched]
-                    y_curr = [item['balance'] for item in curr_sched]
-                    self.ax.plot(x_curr, y_curr, label='Current Mortgage', color='black', linewidth=2.5, linestyle='--')
+                if len(curr_sched):
+                    self.ax.plot(curr_sched['month'] / 12.0, curr_sched['balance'], label='Current Mortgage', color='black', linewidth=2.5, linestyle='--')
             
             colors = plt.cm.tab10.colors
             color_idx = 0
             for i, (_, row) in enumerate(self.results_df.iterrows()):
                 if 'schedule_new' in row:
                     new_sched = row['schedule_new']
-                    if new_sched:
+                    if len(new_sched):
                         name = row.get('custom_scenario_name', f'Scenario {i+1}')
-                        x_new = [item['month']/12.0 for item in new_sched]
-                        y_new = [item['balance'] for item in new_sched]
-                        self.ax.plot(x_new, y_new, label=name, color=colors[color_idx % len(colors)], linewidth=1.5)
+                        self.ax.plot(new_sched['month'] / 12.0, new_sched['balance'], label=name, color=colors[color_idx % len(colors)], linewidth=1.5)
                         color_idx += 1
                         
             self.ax.set_xlabel('Years from Now')
@@ -595,16 +723,20 @@ class MortgageGUI:
     def validate_inputs(self):
         """Validate user inputs"""
         try:
+            rate = self.current_rate.get()
+            balance = self.current_balance.get()
+            payment = self.current_payment.get()
+            
             # Check required fields
-            if self.current_rate.get() <= 0 or self.current_rate.get() > 20:
+            if rate <= 0 or rate > 20:
                 messagebox.showerror("Invalid Input", "Current interest rate must be between 0.1% and 20%")
                 return False
             
-            if self.current_balance.get() <= 0:
+            if balance <= 0:
                 messagebox.showerror("Invalid Input", "Outstanding balance must be greater than $0")
                 return False
             
-            if self.current_payment.get() <= 0:
+            if payment <= 0:
                 messagebox.showerror("Invalid Input", "Monthly payment must be greater than $0")
                 return False
             
@@ -613,8 +745,7 @@ class MortgageGUI:
                 return False
             
             # Check that at least one scenario is enabled
-            enabled_scenarios = sum(1 for sv in self.scenario_vars if sv['enabled'].get())
-            if enabled_scenarios == 0 and not self.recast_enabled.get():
+            if not any(sv['enabled'].get() for sv in self.scenario_vars) and not self.recast_enabled.get():
                 messagebox.showerror("Invalid Input", "Please enable at least one refinance or recast scenario")
                 return False
             
@@ -655,10 +786,10 @@ class MortgageGUI:
             
             # Generate amortization schedule
             if scenario_choice == "current":
-                schedule_df = self.generate_current_mortgage_schedule()
+                schedule = self.generate_current_mortgage_schedule()
                 filename_prefix = "current_mortgage"
             else:
-                schedule_df = self.generate_scenario_schedule(scenario_choice)
+                schedule = self.generate_scenario_schedule(scenario_choice)
                 scenario_name = self.scenario_vars[scenario_choice]['name'].get().replace(" ", "_").lower()
                 filename_prefix = f"scenario_{scenario_name}"
             
@@ -666,7 +797,7 @@ class MortgageGUI:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"{filename_prefix}_amortization_{timestamp}.csv"
             
-            schedule_df.to_csv(filename, index=False)
+            self.write_amortization_csv(filename, schedule)
             
             messagebox.showinfo("Export Complete", 
                               f"Amortization schedule exported to:\n{filename}")
@@ -677,7 +808,8 @@ class MortgageGUI:
     def validate_current_mortgage_inputs(self):
         """Validate current mortgage inputs for amortization"""
         try:
-            if self.current_rate.get() <= 0 or self.current_rate.get() > 20:
+            rate = self.current_rate.get()
+            if rate <= 0 or rate > 20:
                 messagebox.showerror("Invalid Input", "Current interest rate must be between 0.1% and 20%")
                 return False
             
@@ -759,7 +891,7 @@ class MortgageGUI:
         
         # Calculate new payment
         if rate > 0:
-            payment = balance * (rate * (1 + rate)**term_months) / ((1 + rate)**term_months - 1)
+            payment = balance * rate / -np.expm1(-term_months * np.log1p(rate))
         else:
             payment = balance / term_months
             
@@ -768,114 +900,85 @@ class MortgageGUI:
         return self.calculate_amortization_schedule(balance, rate, term_months, payment, scenario_name)
     
     def calculate_amortization_schedule(self, principal, monthly_rate, num_payments, payment, scenario_name):
-        """Calculate detailed amortization schedule"""
-        schedule_data = []
-        remaining_balance = principal
-        
-        for month in range(1, int(num_payments) + 1):
-            # Calculate interest and principal for this payment
-            interest_payment = remaining_balance * monthly_rate
-            principal_payment = min(payment - interest_payment, remaining_balance)
-            
-            # Handle final payment
-            if remaining_balance <= principal_payment:
-                principal_payment = remaining_balance
-                payment = principal_payment + interest_payment
-                remaining_balance = 0
-            else:
-                remaining_balance -= principal_payment
-            
-            schedule_data.append({
-                'Payment_Number': month,
-                'Payment_Date': datetime.now().replace(day=1) + pd.DateOffset(months=month-1),
-                'Beginning_Balance': remaining_balance + principal_payment,
-                'Payment_Amount': payment,
-                'Principal_Payment': principal_payment,
-                'Interest_Payment': interest_payment,
-                'Ending_Balance': remaining_balance,
-                'Cumulative_Principal': principal - remaining_balance,
-                'Cumulative_Interest': sum(row['Interest_Payment'] for row in schedule_data)
-            })
-            
-            if remaining_balance <= 0:
-                break
-        
-        df = pd.DataFrame(schedule_data)
-        
-        # Format currency columns
-        currency_cols = ['Beginning_Balance', 'Payment_Amount', 'Principal_Payment', 
-                        'Interest_Payment', 'Ending_Balance', 'Cumulative_Principal', 'Cumulative_Interest']
+        """Calculate detailed amortization schedule as (summary row dicts, schedule DataFrame)"""
+        import pandas as pd
         
-        for col in currency_cols:
-            df[col] = df[col].round(2)
+        months = np.arange(1, int(num_payments) + 1)
         
-        # Format date column
-        df['Payment_Date'] = df['Payment_Date'].dt.strftime('%Y-%m-%d')
-        
-        # Add scenario info as first row
-        summary_row = pd.DataFrame([{
+        # Closed-form balance after each payment
+        if monthly_rate:
+            growth_less_one = np.expm1(months * np.log1p(monthly_rate))
+            end_balance = principal * (growth_less_one + 1) - payment * growth_less_one / monthly_rate
+        else:
+            end_balance = principal - payment * months
+        
+        # Handle final payment: stop at payoff and pay off exactly the remaining balance
+        paid_off = np.flatnonzero(end_balance <= 0)
+        if paid_off.size:
+            months = months[:paid_off[0] + 1]
+            end_balance = end_balance[:paid_off[0] + 1].copy()
+            end_balance[-1] = 0.0
+        
+        begin_balance = np.concatenate(([principal], end_balance))[:-1]
+        interest_payment = begin_balance * monthly_rate
+        principal_payment = begin_balance - end_balance
+        payment_amount = principal_payment + interest_payment
+        
+        df = pd.DataFrame({
+            'Payment_Number': months,
+            'Payment_Date': pd.date_range(start=datetime.now().replace(day=1), periods=len(months), freq='MS', normalize=True),
+            'Beginning_Balance': begin_balance,
+            'Payment_Amount': payment_amount,
+            'Principal_Payment': principal_payment,
+            'Interest_Payment': interest_payment,
+            'Ending_Balance': end_balance,
+            'Cumulative_Principal': principal - end_balance,
+            'Cumulative_Interest': np.cumsum(interest_payment)
+        }, copy=False)
+        
+        # Totals come straight from the arrays (scalar .iat access, no extra DataFrame)
+        payment_count = len(months)
+        total_interest = df['Cumulative_Interest'].iat[-1]
+        total_cost = payment_amount.sum()
+        
+        # Scenario info row followed by an empty row, written above the schedule
+        summary_rows = [{
             'Payment_Number': f'SCENARIO: {scenario_name}',
             'Payment_Date': f'Rate: {monthly_rate*12*100:.3f}%',
             'Beginning_Balance': f'Original Balance: ${principal:,.2f}',
             'Payment_Amount': f'Monthly Payment: ${payment:,.2f}',
-            'Principal_Payment': f'Total Payments: {len(schedule_data)}',
-            'Interest_Payment': f'Total Interest: ${df["Cumulative_Interest"].iloc[-1]:,.2f}',
-            'Ending_Balance': f'Total Cost: ${payment * len(schedule_data):,.2f}',
+            'Principal_Payment': f'Total Payments: {payment_count}',
+            'Interest_Payment': f'Total Interest: ${total_interest:,.2f}',
+            'Ending_Balance': f'Total Cost: ${total_cost:,.2f}',
             'Cumulative_Principal': '',
             'Cumulative_Interest': ''
-        }])
-        
-        # Add empty row
-        empty_row = pd.DataFrame([{col: '' for col in df.columns}])
-        
-        # Combine summary, empty row, and schedule
-        final_df = pd.concat([summary_row, empty_row, df], ignore_index=True)
+        }, dict.fromkeys(df.columns, '')]
         
-        return final_df
+        # Currency and date columns stay typed; they are formatted when the CSV is written
+        return summary_rows, df
+    
+    def write_amortization_csv(self, filename, schedule):
+        """Write summary rows and amortization schedule to a CSV file"""
+        summary_rows, schedule_df = schedule
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(schedule_df.columns), lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(summary_rows)
+            schedule_df.to_csv(f, index=False, header=False, float_format='%.2f',
+                               date_format='%Y-%m-%d', lineterminator='\n')
     
     def show_help(self):
         """Show help information"""
-        help_text = """
-🏠 ENHANCED MORTGAGE REFINANCE CALCULATOR HELP
-
-This calculator helps you determine if refinancing your mortgage makes financial sense by:
-
-📊 TABS:
-• Current Mortgage: Enter your existing loan details
-• Refinance Scenarios: Set up different refi options to compare  
-• Analysis Options: Choose market data and export settings
-• Results: View detailed analysis and recommendations
-
-💰 KEY FEATURES:
-• Break-even analysis - when you recover closing costs
-• Multiple scenario comparison
-• Buydown points analysis 
-• Real-time market data integration
-• Expert forecast recommendations
-
-🌐 MARKET DATA:
-When enabled, scrapes current rates from:
-• Freddie Mac PMMS
-• Bankrate  
-• Mortgage News Daily
-Plus expert forecasts for timing recommendations.
-
-🎯 BUYDOWN POINTS:
-Check "Buy down with points" to analyze paying upfront to reduce your rate.
-Typical: 1 point = 1% of loan amount, reduces rate by 0.25%
-
-📄 EXPORT:
-Results are saved as CSV files you can open in Excel for detailed analysis.
-
-💡 TIPS:
-• Use realistic rates from actual lender quotes
-• Consider how long you'll stay in the home
-• Factor in your risk tolerance and financial goals
-        """
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._help_window.deiconify()
+            self._help_window.lift()
+            return
         
         help_window = tk.Toplevel(self.root)
         help_window.title("Help")
         help_window.geometry("600x500")
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
+        self._help_window = help_window
         
         help_text_widget = tk.Text(help_window, wrap=tk.WORD, font=('Arial', 10))
         help_scrollbar = ttk.Scrollbar(help_window, orient="vertical", command=help_text_widget.yview)
@@ -884,17 +987,14 @@ Results are saved as CSV files you can open in Excel for detailed analysis.
         help_text_widget.pack(side="left", fill="both", expand=True, padx=10, pady=10)
         help_scrollbar.pack(side="right", fill="y", pady=10)
         
-        help_text_widget.insert(tk.END, help_text)
+        help_text_widget.insert('1.0', HELP_TEXT)
         help_text_widget.config(state=tk.DISABLED)
     
     def show_error(self, message):
         """Show error message"""
         messagebox.showerror("Error", message)
-        self.results_text.config(state=tk.NORMAL)
         self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, f"❌ Error: {message}\n\n")
-        self.results_text.insert(tk.END, "💡 Please check your inputs and try again.")
-        self.results_text.config(state=tk.DISABLED)
+        self.results_text.insert(tk.END, f"❌ Error: {message}\n\n💡 Please check your inputs and try again.")
     
     def run(self):
         """Start the GUI application"""
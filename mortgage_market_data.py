@@ -5,20 +5,111 @@ Collects current rates and expert forecasts from reputable financial sites
 """
 
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import lxml.etree
+import lxml.html
+import csv
 import json
+import os
 import re
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+import hashlib
 import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import logging
+import threading
+from collections import defaultdict
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+HTTP_CACHE_DIR = os.path.join('.cache', 'http')
+HTTP_CACHE_TTL_SECONDS = 3600  # Rates and forecast pages change at most daily
+HTTP_CHUNK_SIZE = 16384
+
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Patterns shared by the scrapers, compiled once at import
+PERCENT_RATE_RE = re.compile(r'(\d+\.\d{2,3})%')
+PMMS_RATE_RE = re.compile(r'(\d+\.\d{2})%')
+TERM_RATE_RE = re.compile(
+    r'(?P<rate_30>\d+\.\d{2,3})%?\s*(?:30|thirty)[\s-]*year'
+    r'|(?P<rate_15>\d+\.\d{2,3})%?\s*(?:15|fifteen)[\s-]*year',
+    re.IGNORECASE
+)
+MORTGAGE_TOPIC_RE = re.compile(r'mortgage|rate', re.IGNORECASE)
+# Direction patterns: group 1 holds the rise phrases, group 2 the fall phrases
+MBA_DIRECTION_RE = re.compile(r'(rates will rise|expect higher rates)|(rates will fall|expect lower rates)')
+DIRECTION_WORDS_RE = re.compile(r'(increase|rise|higher)|(decrease|fall|lower)')
+
+# Text nodes a browser would render (script and style bodies excluded)
+VISIBLE_TEXT_XPATH = '//text()[not(ancestor::script or ancestor::style)]'
+
+# Candidate rate nodes, pre-filtered in libxml2 to those containing a percent sign
+RATE_ELEMENT_XPATH = "//*[self::div or self::span or self::td][contains(., '%')]"
+PERCENT_TEXT_XPATH = "//text()[contains(., '%')][not(ancestor::script or ancestor::style)]"
+
+# Column order of the combined rates/forecasts export
+MARKET_DATA_CSV_FIELDS = [
+    'data_type', 'rate_type', 'value', 'source', 'date', 'lender', 'points',
+    'timeframe', 'direction', 'confidence', 'summary'
+]
+
+def _parse_html(content: bytes):
+    """Parse page bytes into an lxml HTML tree (empty bodies give an empty document)"""
+    if not content or not content.strip():
+        content = b'<html></html>'
+    return lxml.html.document_fromstring(content)
+
+def _element_string(element) -> Optional[str]:
+    """Return the element's only text node, following single-child chains, else None"""
+    while len(element) == 1 and not element.text and not element[0].tail:
+        element = element[0]
+    return element.text if len(element) == 0 else None
+
+def _scan_direction(pattern, text: str) -> str:
+    """Scan text once: 'up' if any rise phrase matches, else 'down' if any fall phrase does, else 'stable'"""
+    direction = 'stable'
+    for match in pattern.finditer(text):
+        if match.lastindex == 1:
+            return 'up'
+        direction = 'down'
+    return direction
+
+def _bankrate_quotes(tree):
+    """Yield (rate_type, rate) for each percentage shown in a Bankrate rate element"""
+    for element in tree.xpath(RATE_ELEMENT_XPATH):
+        if not PERCENT_RATE_RE.search(_element_string(element) or ''):
+            continue
+        text = element.text_content().strip()
+        rate_match = PERCENT_RATE_RE.search(text)
+        if rate_match:
+            rate_value = float(rate_match.group(1)) / 100
+            
+            # Determine rate type based on context
+            parent = element.getparent()
+            context = parent.text_content().lower() if parent is not None else text.lower()
+            if '30' in context and 'year' in context:
+                rate_type = '30-year'
+            elif '15' in context and 'year' in context:
+                rate_type = '15-year'
+            elif 'jumbo' in context:
+                rate_type = '30-year-jumbo'
+            else:
+                rate_type = '30-year'  # Default assumption
+            
+            yield rate_type, rate_value
+
+def _pmms_quotes(tree):
+    """Yield each PMMS rate found in the page's visible text"""
+    for text in tree.xpath(PERCENT_TEXT_XPATH):
+        rate_match = PMMS_RATE_RE.search(text)
+        if rate_match:
+            yield float(rate_match.group(1)) / 100
+
+@dataclass(slots=True, frozen=True)
 class RateData:
     """Container for mortgage rate information"""
     rate_type: str  # '30-year', '15-year', etc.
@@ -28,7 +119,7 @@ class RateData:
     lender: Optional[str] = None
     points: Optional[float] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarketForecast:
     """Container for market forecast information"""
     source: str
@@ -43,56 +134,133 @@ class MortgageMarketDataScraper:
     """Scrapes mortgage rates and forecasts from multiple sources"""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self._local = threading.local()
+        self._source_sessions = {}
+        self._collect_lock = threading.Lock()
+        self._bypass_http_cache = False
+        self._today = None
+        self.http_cache_dir = HTTP_CACHE_DIR
         self.rates_data = []
         self.forecasts_data = []
     
+    def _collection_date(self) -> str:
+        """Date stamp for collected records, fixed for the duration of a comprehensive collection"""
+        if self._today is not None:
+            return self._today
+        now = datetime.now()
+        return f'{now.year}-{now.month:02d}-{now.day:02d}'
+    
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session for the calling thread (requests.Session is not thread-safe)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = self._new_session()
+        return session
+    
+    def _new_session(self) -> requests.Session:
+        """Fresh HTTP session carrying the scraper's request headers"""
+        session = requests.Session()
+        session.headers.update(REQUEST_HEADERS)
+        return session
+    
+    def _source_session(self, source_func) -> requests.Session:
+        """Session kept for one source across collections"""
+        session = self._source_sessions.get(source_func.__name__)
+        if session is None:
+            session = self._source_sessions[source_func.__name__] = self._new_session()
+        return session
+    
+    def _fetch_tree(self, url: str):
+        """Parsed page, from the disk copy while fresh or on 304, else parsed while it downloads"""
+        meta, body = self._read_http_cache(url)
+        if body is not None and time.time() - meta.get('fetched_at', 0) < HTTP_CACHE_TTL_SECONDS:
+            return _parse_html(body)
+        
+        headers = {}
+        if body is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        
+        with self.session.get(url, headers=headers, timeout=10, stream=True) as response:
+            if response.status_code == 304 and body is not None:
+                self._write_http_cache(url, response, body, meta)
+                return _parse_html(body)
+            
+            # Feed chunks to the parser as they arrive so parsing overlaps the download
+            parser = lxml.html.HTMLParser()
+            chunks = []
+            for chunk in response.iter_content(chunk_size=HTTP_CHUNK_SIZE):
+                chunks.append(chunk)
+                parser.feed(chunk)
+            
+            if response.status_code == 200:
+                self._write_http_cache(url, response, b''.join(chunks), {})
+        
+        try:
+            tree = parser.close()
+        except lxml.etree.XMLSyntaxError:
+            tree = None  # Nothing was fed
+        return tree if tree is not None else _parse_html(b'')
+    
+    def _http_cache_paths(self, url: str) -> Optional[Tuple[str, str]]:
+        """Metadata and body paths for a cached URL, or None if caching is disabled"""
+        if not self.http_cache_dir:
+            return None
+        key = os.path.join(self.http_cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest())
+        return key + '.json', key + '.html'
+    
+    def _read_http_cache(self, url: str) -> Tuple[dict, Optional[bytes]]:
+        """Cached validators and body for a URL (empty when missing or bypassed)"""
+        paths = self._http_cache_paths(url)
+        if not paths or self._bypass_http_cache:
+            return {}, None
+        try:
+            with open(paths[0], 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(paths[1], 'rb') as f:
+                return meta, f.read()
+        except (OSError, ValueError):
+            return {}, None
+    
+    def _write_http_cache(self, url: str, response, body: bytes, meta: dict):
+        """Store a page body with its ETag/Last-Modified validators"""
+        paths = self._http_cache_paths(url)
+        if not paths or 'no-store' in response.headers.get('Cache-Control', ''):
+            return
+        try:
+            os.makedirs(self.http_cache_dir, exist_ok=True)
+            with open(paths[1], 'wb') as f:
+                f.write(body)
+            with open(paths[0], 'w', encoding='utf-8') as f:
+                json.dump({
+                    'url': url,
+                    'etag': response.headers.get('ETag', meta.get('etag')),
+                    'last_modified': response.headers.get('Last-Modified', meta.get('last_modified')),
+                    'fetched_at': time.time()
+                }, f)
+        except OSError:
+            pass  # Caching is best-effort
+    
     def get_bankrate_rates(self) -> List[RateData]:
         """Scrape current rates from Bankrate"""
         try:
             url = "https://www.bankrate.com/mortgages/mortgage-rates/"
             logger.info(f"Scraping Bankrate rates from {url}")
             
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            rates = []
-            today = datetime.now().strftime('%Y-%m-%d')
-            
-            # Look for rate table or rate displays
-            rate_elements = soup.find_all(['div', 'span', 'td'], 
-                                        text=re.compile(r'\d+\.\d{2,3}%'))
-            
-            # Parse typical mortgage rate patterns
-            for element in rate_elements:
-                text = element.get_text().strip()
-                rate_match = re.search(r'(\d+\.\d{2,3})%', text)
-                if rate_match:
-                    rate_value = float(rate_match.group(1)) / 100
-                    
-                    # Determine rate type based on context
-                    context = element.parent.get_text().lower() if element.parent else text.lower()
-                    if '30' in context and 'year' in context:
-                        rate_type = '30-year'
-                    elif '15' in context and 'year' in context:
-                        rate_type = '15-year'
-                    elif 'jumbo' in context:
-                        rate_type = '30-year-jumbo'
-                    else:
-                        rate_type = '30-year'  # Default assumption
-                    
-                    rates.append(RateData(
-                        rate_type=rate_type,
-                        rate=rate_value,
-                        source='Bankrate',
-                        date=today
-                    ))
-                    
-                    if len(rates) >= 3:  # Limit to avoid duplicates
-                        break
+            tree = self._fetch_tree(url)
+            
+            today = self._collection_date()
+            
+            # The same quote is repeated across nested elements; keep each one once
+            seen = set()
+            rates = [
+                RateData(rate_type=rate_type, rate=rate_value, source='Bankrate', date=today)
+                for rate_type, rate_value in _bankrate_quotes(tree)
+                if (rate_type, rate_value) not in seen and not seen.add((rate_type, rate_value))
+            ]
             
             logger.info(f"Found {len(rates)} rates from Bankrate")
             return rates
@@ -107,34 +275,22 @@ class MortgageMarketDataScraper:
             url = "https://www.mortgagenewsdaily.com/mortgage-rates"
             logger.info(f"Scraping Mortgage News Daily from {url}")
             
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            rates = []
-            today = datetime.now().strftime('%Y-%m-%d')
+            tree = self._fetch_tree(url)
             
-            # Look for rate displays
-            rate_patterns = [
-                r'(\d+\.\d{2,3})%?\s*(?:30|thirty)[\s-]*year',
-                r'(\d+\.\d{2,3})%?\s*(?:15|fifteen)[\s-]*year'
-            ]
+            today = self._collection_date()
             
-            text_content = soup.get_text()
-            for pattern in rate_patterns:
-                matches = re.finditer(pattern, text_content, re.IGNORECASE)
-                for match in matches:
-                    rate_value = float(match.group(1)) / 100
-                    if '30' in match.group(0) or 'thirty' in match.group(0):
-                        rate_type = '30-year'
-                    else:
-                        rate_type = '15-year'
-                    
-                    rates.append(RateData(
-                        rate_type=rate_type,
-                        rate=rate_value,
-                        source='Mortgage News Daily',
-                        date=today
-                    ))
+            # Look for rate displays; one pass labels 30- and 15-year quotes by the group that matched
+            text_content = ''.join(tree.xpath(VISIBLE_TEXT_XPATH))
+            rates_by_type = {'30-year': [], '15-year': []}
+            for match in TERM_RATE_RE.finditer(text_content):
+                rate_type = '30-year' if match.group('rate_30') else '15-year'
+                rates_by_type[rate_type].append(RateData(
+                    rate_type=rate_type,
+                    rate=float(match.group('rate_30') or match.group('rate_15')) / 100,
+                    source='Mortgage News Daily',
+                    date=today
+                ))
+            rates = rates_by_type['30-year'] + rates_by_type['15-year']
             
             logger.info(f"Found {len(rates)} rates from Mortgage News Daily")
             return rates
@@ -149,29 +305,18 @@ class MortgageMarketDataScraper:
             url = "https://www.freddiemac.com/pmms"
             logger.info(f"Scraping Freddie Mac PMMS data from {url}")
             
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            rates = []
-            today = datetime.now().strftime('%Y-%m-%d')
-            
-            # Look for PMMS rate data
-            rate_elements = soup.find_all(text=re.compile(r'\d+\.\d{2}%'))
-            
-            for element in rate_elements[:4]:  # Limit results
-                rate_match = re.search(r'(\d+\.\d{2})%', element)
-                if rate_match:
-                    rate_value = float(rate_match.group(1)) / 100
-                    
-                    # Freddie Mac typically shows 30-year first, then 15-year
-                    rate_type = '30-year'  # Default for Freddie Mac PMMS
-                    
-                    rates.append(RateData(
-                        rate_type=rate_type,
-                        rate=rate_value,
-                        source='Freddie Mac PMMS',
-                        date=today
-                    ))
+            tree = self._fetch_tree(url)
+            
+            today = self._collection_date()
+            
+            # Look for PMMS rate data, skipping quotes already seen elsewhere on the page.
+            # Freddie Mac typically shows 30-year first, then 15-year; default to 30-year
+            seen = set()
+            rates = [
+                RateData(rate_type='30-year', rate=rate_value, source='Freddie Mac PMMS', date=today)
+                for rate_value in _pmms_quotes(tree)
+                if rate_value not in seen and not seen.add(rate_value)
+            ]
             
             logger.info(f"Found {len(rates)} rates from Freddie Mac")
             return rates
@@ -197,22 +342,16 @@ class MortgageMarketDataScraper:
             url = "https://www.mba.org/news-and-research/forecasts-and-commentary"
             logger.info("Scraping MBA forecast")
             
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = self._fetch_tree(url)
             
             forecasts = []
-            today = datetime.now().strftime('%Y-%m-%d')
+            today = self._collection_date()
             
             # Look for forecast-related content
-            forecast_text = soup.get_text().lower()
+            forecast_text = ''.join(tree.xpath(VISIBLE_TEXT_XPATH)).lower()
             
             # Simple pattern matching for forecast sentiment
-            if 'rates will rise' in forecast_text or 'expect higher rates' in forecast_text:
-                direction = 'up'
-            elif 'rates will fall' in forecast_text or 'expect lower rates' in forecast_text:
-                direction = 'down'
-            else:
-                direction = 'stable'
+            direction = _scan_direction(MBA_DIRECTION_RE, forecast_text)
             
             forecasts.append(MarketForecast(
                 source='MBA',
@@ -236,24 +375,21 @@ class MortgageMarketDataScraper:
             url = "https://www.fanniemae.com/research-and-insights/forecast"
             logger.info("Scraping Fannie Mae forecast")
             
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = self._fetch_tree(url)
             
             forecasts = []
-            today = datetime.now().strftime('%Y-%m-%d')
+            today = self._collection_date()
             
-            # Extract forecast data from page content
-            forecast_content = soup.find_all(['p', 'div'], text=re.compile(r'mortgage|rate', re.IGNORECASE))
+            # Extract forecast text from mortgage/rate content in the same walk
+            full_text = ' '.join(
+                element.text_content() for element in tree.iter('p', 'div')
+                if MORTGAGE_TOPIC_RE.search(_element_string(element) or '')
+            ).lower()
             
-            direction = 'stable'  # Default
             summary = "Fannie Mae housing and mortgage market forecast"
             
             # Look for directional indicators in text
-            full_text = ' '.join([elem.get_text() for elem in forecast_content]).lower()
-            if 'increase' in full_text or 'rise' in full_text or 'higher' in full_text:
-                direction = 'up'
-            elif 'decrease' in full_text or 'fall' in full_text or 'lower' in full_text:
-                direction = 'down'
+            direction = _scan_direction(DIRECTION_WORDS_RE, full_text)
             
             forecasts.append(MarketForecast(
                 source='Fannie Mae',
@@ -276,7 +412,7 @@ class MortgageMarketDataScraper:
         try:
             # This would scrape from mortgage industry news sites
             # For demo purposes, creating a sample forecast
-            today = datetime.now().strftime('%Y-%m-%d')
+            today = self._collection_date()
             
             forecasts = [
                 MarketForecast(
@@ -295,30 +431,55 @@ class MortgageMarketDataScraper:
             logger.error(f"Error scraping mortgage professional forecast: {str(e)}")
             return []
     
-    def get_comprehensive_market_data(self) -> Tuple[List[RateData], List[MarketForecast]]:
-        """Collect all market data with delays to be respectful to websites"""
+    def get_comprehensive_market_data(self, force_refresh: bool = False) -> Tuple[List[RateData], List[MarketForecast]]:
+        """Collect all market data, fetching every source concurrently"""
+        with self._collect_lock:
+            return self._collect_all_sources(force_refresh)
+    
+    def _collect_all_sources(self, force_refresh: bool) -> Tuple[List[RateData], List[MarketForecast]]:
+        """Fan every source out to its own daemon thread and gather the results in source order"""
         logger.info("Starting comprehensive market data collection...")
+        self._bypass_http_cache = force_refresh
+        self._today = self._collection_date()
         
-        all_rates = []
-        
-        # Collect rates from multiple sources with delays
-        sources = [
+        rate_sources = [
             self.get_freddie_mac_rates,
             self.get_bankrate_rates,
             self.get_mortgage_news_daily_rates
         ]
+        forecast_sources = [
+            self._scrape_mba_forecast,
+            self._scrape_fannie_mae_forecast,
+            self._scrape_mortgage_professional_forecast
+        ]
         
-        for source_func in sources:
-            try:
-                rates = source_func()
-                all_rates.extend(rates)
-                time.sleep(2)  # Be respectful to websites
-            except Exception as e:
-                logger.error(f"Error in source {source_func.__name__}: {str(e)}")
-                continue
+        # Every source is a different site, so each still sees a single request.
+        # Each source keeps its own session across collections (the lock above keeps
+        # it on one thread at a time) so keep-alive connections are reused. The
+        # threads are daemons: unlike pool workers, an in-flight fetch is not
+        # joined at interpreter exit, so closing the app never waits on a timeout.
+        sources = rate_sources + forecast_sources
+        results = [[] for _ in sources]
+        workers = [
+            threading.Thread(
+                target=self._collect_source,
+                args=(source, self._source_session(source), results, i),
+                name=f'market-data-{source.__name__}',
+                daemon=True
+            )
+            for i, source in enumerate(sources)
+        ]
+        try:
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        finally:
+            self._bypass_http_cache = False
+            self._today = None
         
-        # Collect forecasts
-        forecasts = self.get_market_forecasts()
+        all_rates = [rate for rates in results[:len(rate_sources)] for rate in rates]
+        forecasts = [forecast for found in results[len(rate_sources):] for forecast in found]
         
         # Store data
         self.rates_data = all_rates
@@ -327,22 +488,27 @@ class MortgageMarketDataScraper:
         logger.info(f"Collected {len(all_rates)} rate data points and {len(forecasts)} forecasts")
         return all_rates, forecasts
     
+    def _collect_source(self, source_func, session: requests.Session, results: list, index: int):
+        """Thread target: run one scraper on its session into results[index], logging and skipping it if it fails"""
+        self._local.session = session
+        try:
+            results[index] = source_func()
+        except Exception as e:
+            logger.error(f"Error in source {source_func.__name__}: {str(e)}")
+    
     def get_average_rates(self) -> Dict[str, float]:
         """Calculate average rates by loan type"""
         if not self.rates_data:
             return {}
         
-        df = pd.DataFrame([
-            {
-                'rate_type': rate.rate_type,
-                'rate': rate.rate,
-                'source': rate.source
-            }
-            for rate in self.rates_data
-        ])
+        # Accumulate sums and counts per loan type in a single pass
+        sums = defaultdict(float)
+        counts = defaultdict(int)
+        for rate in self.rates_data:
+            sums[rate.rate_type] += rate.rate
+            counts[rate.rate_type] += 1
         
-        # Calculate averages by rate type
-        averages = df.groupby('rate_type')['rate'].mean().to_dict()
+        averages = {rate_type: sums[rate_type] / counts[rate_type] for rate_type in sorted(sums)}
         return averages
     
     def export_market_data(self, filename: str = None) -> str:
@@ -350,38 +516,36 @@ class MortgageMarketDataScraper:
         if filename is None:
             filename = f"mortgage_market_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         
-        # Combine rates and forecasts data
-        rates_df = pd.DataFrame([
-            {
-                'data_type': 'rate',
-                'rate_type': rate.rate_type,
-                'value': rate.rate,
-                'source': rate.source,
-                'date': rate.date,
-                'lender': rate.lender,
-                'points': rate.points
-            }
-            for rate in self.rates_data
-        ])
-        
-        forecasts_df = pd.DataFrame([
-            {
-                'data_type': 'forecast',
-                'rate_type': 'forecast',
-                'value': forecast.predicted_change,
-                'source': forecast.source,
-                'date': forecast.forecast_date,
-                'timeframe': forecast.timeframe,
-                'direction': forecast.direction,
-                'confidence': forecast.confidence,
-                'summary': forecast.summary
-            }
-            for forecast in self.forecasts_data
-        ])
-        
-        # Combine and export
-        combined_df = pd.concat([rates_df, forecasts_df], ignore_index=True, sort=False)
-        combined_df.to_csv(filename, index=False)
+        # Stream rates followed by forecasts straight to the CSV
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=MARKET_DATA_CSV_FIELDS, lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(
+                {
+                    'data_type': 'rate',
+                    'rate_type': rate.rate_type,
+                    'value': rate.rate,
+                    'source': rate.source,
+                    'date': rate.date,
+                    'lender': rate.lender,
+                    'points': rate.points
+                }
+                for rate in self.rates_data
+            )
+            writer.writerows(
+                {
+                    'data_type': 'forecast',
+                    'rate_type': 'forecast',
+                    'value': forecast.predicted_change,
+                    'source': forecast.source,
+                    'date': forecast.forecast_date,
+                    'timeframe': forecast.timeframe,
+                    'direction': forecast.direction,
+                    'confidence': forecast.confidence,
+                    'summary': forecast.summary
+                }
+                for forecast in self.forecasts_data
+            )
         
         return filename
 
@@ -4,12 +4,62 @@ Mortgage Refinance Calculator
 Analyzes break-even points and total savings for mortgage refinancing decisions
 """
 
+import functools
+import itertools
+import math
 import numpy as np
 import pandas as pd
 from datetime import datetime
 import csv
+import gzip
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple
+
+PAYOFF_TOLERANCE = 0.005  # Half a cent
+
+# One record per month of an amortization schedule
+SCHEDULE_DTYPE = np.dtype([
+    ('month', np.int64),
+    ('balance', np.float64),
+    ('interest_paid', np.float64),
+    ('principal_paid', np.float64),
+    ('total_payment', np.float64)
+])
+
+# Financial recommendations, indexed by the category _generate_recommendations_vectorized assigns
+RECOMMENDATIONS = np.array([
+    "NOT RECOMMENDED - Higher monthly payment",
+    "NOT RECOMMENDED - Never breaks even",
+    "HIGHLY RECOMMENDED - Quick break-even",
+    "RECOMMENDED - Reasonable break-even period",
+    "CONSIDER - Long break-even but potential savings",
+    "NOT RECOMMENDED - Break-even too long"
+], dtype=object)
+
+@functools.lru_cache(maxsize=4096)
+def _monthly_payment(principal: float, annual_rate: float, months: int) -> float:
+    """Standard mortgage payment, memoized for sweeps that revisit the same loan terms"""
+    if annual_rate == 0:
+        return principal / months
+    
+    # P*r / (1 - (1+r)**-n), with the power taken through log1p/expm1 so it
+    # stays accurate (and is computed once) even for tiny monthly rates
+    monthly_rate = annual_rate / 12
+    payment = principal * monthly_rate / -math.expm1(-months * math.log1p(monthly_rate))
+    return payment
+
+def monthly_payments(principal, annual_rate: np.ndarray, months: np.ndarray) -> np.ndarray:
+    """Standard mortgage payment for arrays of rates and terms (zero rates pay straight-line)"""
+    monthly_rate = annual_rate / 12
+    with np.errstate(divide='ignore', invalid='ignore'):
+        payment = principal * monthly_rate / -np.expm1(-months * np.log1p(monthly_rate))
+    return np.where(annual_rate == 0, principal / months, payment)
+
+def _horizon_position(schedule: np.ndarray, months_limit: int, start_balance: float) -> Tuple[float, float]:
+    """Cash paid and balance left after the first months_limit months of a schedule"""
+    window = schedule[:months_limit]
+    balance = window['balance'][-1] if len(window) else start_balance
+    return window['total_payment'].sum(), balance
 
 @dataclass
 class MortgageDetails:
@@ -21,6 +71,27 @@ class MortgageDetails:
     extra_monthly_payment: float = 0.0
     extra_one_time_payment: float = 0.0
 
+@dataclass
+class MortgageDetailsBatch:
+    """Portfolio of mortgages stored as parallel arrays (one entry per loan)"""
+    rate: np.ndarray  # Annual interest rates (as decimals)
+    balance: np.ndarray  # Outstanding balances
+    payment: np.ndarray  # Current monthly payments (P&I only)
+    
+    @classmethod
+    def from_mortgages(cls, mortgages: List[MortgageDetails]) -> 'MortgageDetailsBatch':
+        """Stack individual loans into column arrays"""
+        # remaining_months and the extra payments are not carried over: the portfolio metrics
+        # are all based on the scheduled payment and never read them, as in analyze_refinance
+        return cls(
+            rate=np.array([m.rate for m in mortgages], dtype=float),
+            balance=np.array([m.balance for m in mortgages], dtype=float),
+            payment=np.array([m.payment for m in mortgages], dtype=float)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.balance)
+
 @dataclass
 class RefinanceOptions:
     """Container for refinance options"""
@@ -41,61 +112,85 @@ class RecastOptions:
     extra_monthly_payment: float = 0.0
     extra_one_time_payment: float = 0.0
 
+def _format_csv_cell(value, formatter) -> str:
+    """Format one exported cell, leaving missing values blank"""
+    if value is None or value != value:
+        return ''
+    return formatter(value)
+
 class MortgageRefinanceCalculator:
     """Comprehensive mortgage refinance analysis calculator"""
     
     def __init__(self):
-        self.results = []
+        self.results = None  # DataFrame from the last compare_scenarios call
     
     def calculate_monthly_payment(self, principal: float, annual_rate: float, months: int) -> float:
         """Calculate monthly payment using standard mortgage formula"""
-        if annual_rate == 0:
-            return principal / months
-        
-        monthly_rate = annual_rate / 12
-        payment = principal * (monthly_rate * (1 + monthly_rate)**months) / ((1 + monthly_rate)**months - 1)
-        return payment
+        return _monthly_payment(principal, annual_rate, months)
     
     def generate_amortization_schedule(self, principal: float, annual_rate: float,
                                        base_monthly_payment: float,
                                        extra_monthly: float = 0.0,
                                        extra_one_time: float = 0.0,
                                        max_months: int = 3600) -> Dict:
-        """Simulate month-by-month paydown, returning totals and the schedule array."""
-        schedule = []
-        balance = principal
-        total_interest = 0.0
-        months_elapsed = 0
+        """Compute the month-by-month paydown in closed form, returning totals and the schedule array."""
         monthly_rate = annual_rate / 12 if annual_rate > 0 else 0
+        if principal <= 0 or max_months <= 0:
+            return {
+                "schedule": np.empty(0, dtype=SCHEDULE_DTYPE),
+                "months_to_payoff": 0,
+                "total_interest": 0.0,
+                "total_payments": principal
+            }
+        
+        # Balance after month 1 (which also carries the one-time extra), then for month 1+j:
+        # balance = first_balance*(1+r)**j - payment*((1+r)**j - 1)/r
+        payment = base_monthly_payment + extra_monthly
+        first_balance = principal * (1 + monthly_rate) - (payment + extra_one_time)
+        elapsed = np.arange(max_months)
+        with np.errstate(over='ignore', invalid='ignore'):
+            if monthly_rate:
+                growth_less_one = np.expm1(elapsed * np.log1p(monthly_rate))
+                balances = first_balance * (growth_less_one + 1) - payment * growth_less_one / monthly_rate
+            else:
+                balances = first_balance - payment * elapsed
+        
+        # The loan is paid off in the first month whose uncapped balance reaches zero;
+        # a sub-cent remainder is rounding error and is folded into that final payment
+        paid_off = np.flatnonzero(balances < PAYOFF_TOLERANCE)
+        months_elapsed = int(paid_off[0]) + 1 if len(paid_off) else max_months
+        
+        balance = balances[:months_elapsed]
+        begin_balance = np.concatenate(([principal], balance[:-1]))
+        interest_payment = begin_balance * monthly_rate
+        total_payment = np.full(months_elapsed, payment)
+        total_payment[0] += extra_one_time
+        principal_payment = total_payment - interest_payment
+        
+        if len(paid_off):
+            # Final payment only covers what is left
+            principal_payment[-1] = begin_balance[-1]
+            total_payment[-1] = begin_balance[-1] + interest_payment[-1]
+            balance[-1] = 0.0
+        
+        total_interest = float(interest_payment.sum())
+        
+        # Prevent bad input loops: stop once payments stop reducing principal past month 1000
+        scheduled_months = months_elapsed
+        if extra_monthly <= 0 and months_elapsed > 1000:
+            stalled = np.flatnonzero(principal_payment[1000:] <= 0)
+            if len(stalled):
+                months_elapsed = 1000 + int(stalled[0]) + 1
+                total_interest = float(interest_payment[:months_elapsed].sum())
+                scheduled_months = months_elapsed - 1
+        
+        schedule = np.empty(scheduled_months, dtype=SCHEDULE_DTYPE)
+        schedule['month'] = elapsed[:scheduled_months] + 1
+        schedule['balance'] = balance[:scheduled_months]
+        schedule['interest_paid'] = interest_payment[:scheduled_months]
+        schedule['principal_paid'] = principal_payment[:scheduled_months]
+        schedule['total_payment'] = total_payment[:scheduled_months]
         
-        while balance > 0 and months_elapsed < max_months:
-            months_elapsed += 1
-            current_extra = extra_monthly + (extra_one_time if months_elapsed == 1 else 0.0)
-            
-            interest_payment = balance * monthly_rate
-            total_payment = base_monthly_payment + current_extra
-            
-            principal_payment = total_payment - interest_payment
-            
-            if principal_payment >= balance:
-                principal_payment = balance
-                total_payment = balance + interest_payment
-                
-            balance -= principal_payment
-            total_interest += interest_payment
-            
-            if principal_payment <= 0 and current_extra <= 0:
-                if months_elapsed > 1000:  # Prevent bad input loops
-                    break
-                    
-            schedule.append({
-                "month": months_elapsed,
-                "balance": balance,
-                "interest_paid": interest_payment,
-                "principal_paid": principal_payment,
-                "total_payment": total_payment
-            })
-            
         return {
             "schedule": schedule,
             "months_to_payoff": months_elapsed,
@@ -105,8 +200,19 @@ class MortgageRefinanceCalculator:
     
     def analyze_refinance(self, current_mortgage: MortgageDetails, refi_options: RefinanceOptions) -> Dict:
         """Comprehensive refinance analysis"""
+        columns = self._analyze_refinance_batch(current_mortgage, [refi_options])
+        return {
+            name: (column.tolist() if isinstance(column, np.ndarray) else column)[0]
+            for name, column in columns.items()
+        }
+    
+    def _analyze_refinance_batch(self, current_mortgage: MortgageDetails,
+                                 options: List[RefinanceOptions]) -> Dict:
+        """Refinance analysis for several options at once, returning one column per metric"""
+        count = len(options)
+        balance = current_mortgage.balance
         
-        # Current loan schedule calculation
+        # Current loan schedule calculation (shared by every option)
         current_res = self.generate_amortization_schedule(
             principal=current_mortgage.balance, 
             annual_rate=current_mortgage.rate, 
@@ -118,49 +224,50 @@ class MortgageRefinanceCalculator:
         current_total_payments = current_res["total_payments"]
         current_months_to_payoff = current_res["months_to_payoff"]
         
-        # Calculate refinance details
-        effective_rate = refi_options.new_rate - (refi_options.buydown_points * refi_options.rate_reduction_per_point)
-        buydown_cost = current_mortgage.balance * (refi_options.buydown_points * refi_options.point_cost_per_point)
-        total_upfront_cost = refi_options.closing_costs + buydown_cost
+        # Calculate refinance details for all options in one pass
+        new_rate = np.array([o.new_rate for o in options], dtype=float)
+        new_term_months = np.array([o.new_term_months for o in options])
+        closing_costs = np.array([o.closing_costs for o in options])
+        buydown_points = np.array([o.buydown_points for o in options])
+        point_cost_per_point = np.array([o.point_cost_per_point for o in options], dtype=float)
+        rate_reduction_per_point = np.array([o.rate_reduction_per_point for o in options], dtype=float)
         
-        base_new_monthly_payment = self.calculate_monthly_payment(
-            current_mortgage.balance, effective_rate, refi_options.new_term_months
-        )
+        effective_rate = new_rate - (buydown_points * rate_reduction_per_point)
+        buydown_cost = balance * (buydown_points * point_cost_per_point)
+        total_upfront_cost = closing_costs + buydown_cost
         
-        new_res = self.generate_amortization_schedule(
-            principal=current_mortgage.balance,
-            annual_rate=effective_rate,
-            base_monthly_payment=base_new_monthly_payment,
-            extra_monthly=refi_options.extra_monthly_payment,
-            extra_one_time=refi_options.extra_one_time_payment
-        )
-        new_total_interest = new_res["total_interest"]
-        new_total_payments = new_res["total_payments"]
-        new_months_to_payoff = new_res["months_to_payoff"]
+        base_new_monthly_payment = monthly_payments(balance, effective_rate, new_term_months)
+        
+        new_results = [
+            self.generate_amortization_schedule(
+                principal=balance,
+                annual_rate=rate,
+                base_monthly_payment=payment,
+                extra_monthly=o.extra_monthly_payment,
+                extra_one_time=o.extra_one_time_payment
+            )
+            for o, rate, payment in zip(options, effective_rate.tolist(), base_new_monthly_payment.tolist())
+        ]
+        new_total_interest = np.array([res["total_interest"] for res in new_results], dtype=float)
+        new_total_payments = np.array([res["total_payments"] for res in new_results], dtype=float)
+        new_months_to_payoff = np.array([res["months_to_payoff"] for res in new_results], dtype=np.int64)
         
         monthly_savings = current_mortgage.payment - base_new_monthly_payment
         
         # Break-even roughly based on base payment drop
-        break_even_months = total_upfront_cost / monthly_savings if monthly_savings > 0 else float('inf')
+        with np.errstate(divide='ignore', invalid='ignore'):
+            break_even_months = np.where(monthly_savings > 0, total_upfront_cost / monthly_savings, np.inf)
         break_even_years = break_even_months / 12
         
-        # Net savings arrays over 5/10/full term
+        # Net savings over 5/10 years: (cash outflows + end debt) current vs new
         sched_curr = current_res['schedule']
-        sched_new = new_res['schedule']
+        sched_new = [res['schedule'] for res in new_results]
         
         def calculate_horizon_net(months_limit):
-            curr_slice = sched_curr[:months_limit]
-            new_slice = sched_new[:months_limit]
-            curr_paid = sum(x['total_payment'] for x in curr_slice)
-            new_paid = sum(x['total_payment'] for x in new_slice)
-            
-            curr_bal = curr_slice[-1]['balance'] if curr_slice else current_mortgage.balance
-            new_bal = new_slice[-1]['balance'] if new_slice else current_mortgage.balance
-            
-            # (Cash outflows current + End debt current) vs (Cash outflows + End debt new)
-            curr_net_cost = curr_paid + curr_bal
-            new_net_cost = new_paid + new_bal + total_upfront_cost
-            return curr_net_cost - new_net_cost
+            curr_paid, curr_bal = _horizon_position(sched_curr, months_limit, balance)
+            new_position = np.array([_horizon_position(sched, months_limit, balance) for sched in sched_new],
+                                    dtype=float).reshape(count, 2)
+            return (curr_paid + curr_bal) - (new_position[:, 0] + new_position[:, 1] + total_upfront_cost)
             
         savings_5_years = calculate_horizon_net(60)
         savings_10_years = calculate_horizon_net(120)
@@ -170,27 +277,30 @@ class MortgageRefinanceCalculator:
         net_interest_savings = interest_savings_full_term - total_upfront_cost
         
         return {
-            'scenario_name': f"Refi: {effective_rate*100:.3f}% rate, {refi_options.new_term_months//12}yr term",
-            'current_rate': current_mortgage.rate * 100,
-            'current_payment': current_mortgage.payment,
-            'current_remaining_balance': current_mortgage.balance,
-            'current_remaining_months': current_months_to_payoff,
-            'current_total_payments_remaining': current_total_payments,
-            'current_total_interest_remaining': current_total_interest,
+            'scenario_name': [
+                f"Refi: {rate*100:.3f}% rate, {o.new_term_months//12}yr term"
+                for o, rate in zip(options, effective_rate.tolist())
+            ],
+            'current_rate': np.full(count, current_mortgage.rate * 100),
+            'current_payment': np.full(count, current_mortgage.payment),
+            'current_remaining_balance': np.full(count, current_mortgage.balance),
+            'current_remaining_months': np.full(count, current_months_to_payoff),
+            'current_total_payments_remaining': np.full(count, current_total_payments),
+            'current_total_interest_remaining': np.full(count, current_total_interest),
             
-            'new_rate_before_buydown': refi_options.new_rate * 100,
-            'buydown_points': refi_options.buydown_points,
+            'new_rate_before_buydown': new_rate * 100,
+            'buydown_points': buydown_points,
             'buydown_cost': buydown_cost,
             'effective_rate_after_buydown': effective_rate * 100,
             'new_monthly_payment': base_new_monthly_payment,
-            'new_term_months': refi_options.new_term_months,
+            'new_term_months': new_term_months,
             'new_payoff_months': new_months_to_payoff,
-            'closing_costs': refi_options.closing_costs,
+            'closing_costs': closing_costs,
             'total_upfront_cost': total_upfront_cost,
             
             'monthly_savings': monthly_savings,
-            'break_even_months': break_even_months if break_even_months != float('inf') else 'Never',
-            'break_even_years': break_even_years if break_even_years != float('inf') else 'Never',
+            'break_even_months': [months if months != float('inf') else 'Never' for months in break_even_months.tolist()],
+            'break_even_years': [years if years != float('inf') else 'Never' for years in break_even_years.tolist()],
             
             'new_total_payments': new_total_payments,
             'new_total_interest': new_total_interest,
@@ -201,25 +311,27 @@ class MortgageRefinanceCalculator:
             
             'interest_savings_full_term': interest_savings_full_term,
             'net_interest_savings': net_interest_savings,
-            'schedule_current': current_res['schedule'],
-            'schedule_new': new_res['schedule'],
-            'recommendation': self._generate_recommendation(break_even_years, monthly_savings, savings_5_years)
+            'schedule_current': [sched_curr] * count,
+            'schedule_new': sched_new,
+            'recommendation': self._generate_recommendations_vectorized(
+                break_even_years, monthly_savings, savings_5_years)
         }
     
-    def _generate_recommendation(self, break_even_years: float, monthly_savings: float, savings_5_years: float) -> str:
-        """Generate recommendation based on analysis"""
-        if monthly_savings <= 0:
-            return "NOT RECOMMENDED - Higher monthly payment"
-        elif break_even_years == float('inf'):
-            return "NOT RECOMMENDED - Never breaks even"
-        elif break_even_years <= 2:
-            return "HIGHLY RECOMMENDED - Quick break-even"
-        elif break_even_years <= 5 and savings_5_years > 0:
-            return "RECOMMENDED - Reasonable break-even period"
-        elif break_even_years <= 10:
-            return "CONSIDER - Long break-even but potential savings"
-        else:
-            return "NOT RECOMMENDED - Break-even too long"
+    def _generate_recommendations_vectorized(self, break_even_years: np.ndarray, monthly_savings: np.ndarray,
+                                             savings_5_years: np.ndarray) -> np.ndarray:
+        """Generate a recommendation for every scenario at once"""
+        categories = np.select(
+            [
+                monthly_savings <= 0,
+                np.isinf(break_even_years),
+                break_even_years <= 2,
+                (break_even_years <= 5) & (savings_5_years > 0),
+                break_even_years <= 10
+            ],
+            [0, 1, 2, 3, 4],
+            default=5
+        )
+        return RECOMMENDATIONS[categories]
             
     def analyze_recast(self, current_mortgage: MortgageDetails, recast_options: RecastOptions) -> Dict:
         """Analyze the impact of a mortgage recast"""
@@ -238,7 +350,7 @@ class MortgageRefinanceCalculator:
         
         if new_balance == 0:
             base_new_monthly_payment = 0
-            new_res = {"schedule": [], "total_interest": 0, "total_payments": 0, "months_to_payoff": 0}
+            new_res = {"schedule": np.empty(0, dtype=SCHEDULE_DTYPE), "total_interest": 0, "total_payments": 0, "months_to_payoff": 0}
         else:
             base_new_monthly_payment = self.calculate_monthly_payment(
                 new_balance, current_mortgage.rate, current_mortgage.remaining_months
@@ -266,11 +378,11 @@ class MortgageRefinanceCalculator:
         def calculate_horizon_net(months_limit):
             curr_slice = sched_curr[:months_limit]
             new_slice = sched_new[:months_limit]
-            curr_paid = sum(x['total_payment'] for x in curr_slice)
-            new_paid = sum(x['total_payment'] for x in new_slice)
+            curr_paid = curr_slice['total_payment'].sum()
+            new_paid = new_slice['total_payment'].sum()
             
-            curr_bal = curr_slice[-1]['balance'] if curr_slice else current_mortgage.balance
-            new_bal = new_slice[-1]['balance'] if new_slice else new_balance
+            curr_bal = curr_slice['balance'][-1] if len(curr_slice) else current_mortgage.balance
+            new_bal = new_slice['balance'][-1] if len(new_slice) else new_balance
             
             curr_net_cost = curr_paid + curr_bal
             new_net_cost = new_paid + new_bal + recast_options.lump_sum_payment + recast_options.recast_fee
@@ -329,28 +441,65 @@ class MortgageRefinanceCalculator:
             'new_term_months': current_mortgage.remaining_months
         }
     
+    def analyze_portfolio(self, loans: MortgageDetailsBatch,
+                          options: List[RefinanceOptions]) -> Dict[str, np.ndarray]:
+        """Payment and break-even metrics for every loan/option pair, as (loans, options) arrays"""
+        new_rate = np.array([o.new_rate for o in options], dtype=float)
+        new_term_months = np.array([o.new_term_months for o in options])
+        closing_costs = np.array([o.closing_costs for o in options], dtype=float)
+        buydown_points = np.array([o.buydown_points for o in options], dtype=float)
+        point_cost_per_point = np.array([o.point_cost_per_point for o in options], dtype=float)
+        rate_reduction_per_point = np.array([o.rate_reduction_per_point for o in options], dtype=float)
+        
+        # Loans run down the rows and options across the columns
+        balance = loans.balance[:, None]
+        effective_rate = new_rate - (buydown_points * rate_reduction_per_point)
+        buydown_cost = balance * (buydown_points * point_cost_per_point)
+        total_upfront_cost = closing_costs + buydown_cost
+        
+        new_monthly_payment = monthly_payments(balance, effective_rate, new_term_months)
+        monthly_savings = loans.payment[:, None] - new_monthly_payment
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            break_even_months = np.where(monthly_savings > 0, total_upfront_cost / monthly_savings, np.inf)
+        
+        return {
+            'rate_reduction': loans.rate[:, None] - effective_rate,
+            'buydown_cost': buydown_cost,
+            'total_upfront_cost': total_upfront_cost,
+            'new_monthly_payment': new_monthly_payment,
+            'monthly_savings': monthly_savings,
+            'break_even_months': break_even_months,
+            'break_even_years': break_even_months / 12
+        }
+    
     def compare_scenarios(self, current_mortgage: MortgageDetails, 
                          scenarios: List[Tuple[str, RefinanceOptions]]) -> pd.DataFrame:
         """Compare multiple refinance scenarios"""
-        results = []
+        if not scenarios:
+            self.results = pd.DataFrame()
+            return self.results.copy()
         
-        for scenario_name, refi_options in scenarios:
-            analysis = self.analyze_refinance(current_mortgage, refi_options)
-            analysis['custom_scenario_name'] = scenario_name
-            results.append(analysis)
+        # One array per metric, so the frame is assembled column by column with no per-row dicts;
+        # the arrays are freshly built for this call, so the frame can wrap them without copying
+        columns = self._analyze_refinance_batch(current_mortgage, [refi_options for _, refi_options in scenarios])
+        columns['custom_scenario_name'] = [scenario_name for scenario_name, _ in scenarios]
         
-        self.results = results
-        return pd.DataFrame(results)
+        self.results = pd.DataFrame(columns, copy=False)
+        # Callers get their own frame, so adding or editing columns leaves self.results alone
+        return self.results.copy()
     
-    def export_to_csv(self, filename: str = None) -> str:
-        """Export analysis results to CSV file"""
-        if not self.results:
+    def export_to_csv(self, filename: str = None, compress: bool = False) -> str:
+        """Export analysis results to CSV file, gzip-compressed when compress is set or the name ends in .gz"""
+        if self.results is None or self.results.empty:
             raise ValueError("No analysis results to export. Run compare_scenarios first.")
         
         if filename is None:
             filename = f"mortgage_refi_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        if compress and not filename.endswith('.gz'):
+            filename += '.gz'
         
-        df = pd.DataFrame(self.results)
+        df = self.results
         
         # Reorder columns for better readability
         column_order = [
@@ -368,7 +517,6 @@ class MortgageRefinanceCalculator:
         
         # Only include columns that exist in the dataframe
         available_columns = [col for col in column_order if col in df.columns]
-        df_ordered = df[available_columns]
         
         # Format currency columns
         currency_cols = [
@@ -380,17 +528,23 @@ class MortgageRefinanceCalculator:
             'interest_savings_full_term', 'net_interest_savings'
         ]
         
-        for col in currency_cols:
-            if col in df_ordered.columns:
-                df_ordered[col] = df_ordered[col].apply(lambda x: f"${x:,.2f}" if pd.notnull(x) and x != 'Never' else x)
-        
         # Format percentage columns
         percentage_cols = ['current_rate', 'new_rate_before_buydown', 'effective_rate_after_buydown']
-        for col in percentage_cols:
-            if col in df_ordered.columns:
-                df_ordered[col] = df_ordered[col].apply(lambda x: f"{x:.3f}%" if pd.notnull(x) else x)
         
-        df_ordered.to_csv(filename, index=False)
+        formatters = dict.fromkeys(currency_cols, '${:,.2f}'.format)
+        formatters.update(dict.fromkeys(percentage_cols, '{:.3f}%'.format))
+        
+        # Format lazily column by column; zip hands the writer one row at a time
+        formatted_columns = [
+            map(_format_csv_cell, df[col].tolist(), itertools.repeat(formatters.get(col, str)))
+            for col in available_columns
+        ]
+        
+        opener = gzip.open if filename.endswith('.gz') else open
+        with opener(filename, 'wt', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(available_columns)
+            writer.writerows(zip(*formatted_columns))
         return filename
 
 def main():
@@ -454,14 +608,21 @@ def main():
     print("REFINANCE SCENARIO COMPARISON")
     print("=" * 50)
     
-    for _, row in results_df.iterrows():
-        print(f"\n📊 {row['custom_scenario_name']}")
-        print(f"   Effective Rate: {row['effective_rate_after_buydown']:.3f}%")
-        print(f"   Monthly Payment: ${row['new_monthly_payment']:,.2f}")
-        print(f"   Monthly Savings: ${row['monthly_savings']:,.2f}")
-        print(f"   Break-even: {row['break_even_years']:.1f} years" if isinstance(row['break_even_years'], (int, float)) and row['break_even_years'] != float('inf') else f"   Break-even: {row['break_even_years']}")
-        print(f"   5-Year Savings: ${row['savings_5_years']:,.2f}")
-        print(f"   Recommendation: {row['recommendation']}")
+    # Format whole columns at once and print every scenario block in a single call
+    break_even_years = pd.to_numeric(results_df['break_even_years'], errors='coerce')
+    break_even_text = break_even_years.map('{:.1f} years'.format, na_action='ignore').fillna(
+        results_df['break_even_years'].astype(str))
+    
+    scenario_blocks = (
+        "\n📊 " + results_df['custom_scenario_name']
+        + "\n   Effective Rate: " + results_df['effective_rate_after_buydown'].map('{:.3f}%'.format)
+        + "\n   Monthly Payment: $" + results_df['new_monthly_payment'].map('{:,.2f}'.format)
+        + "\n   Monthly Savings: $" + results_df['monthly_savings'].map('{:,.2f}'.format)
+        + "\n   Break-even: " + break_even_text
+        + "\n   5-Year Savings: $" + results_df['savings_5_years'].map('{:,.2f}'.format)
+        + "\n   Recommendation: " + results_df['recommendation']
+    )
+    print("\n".join(scenario_blocks))
     
     # Export to CSV
     filename = calculator.export_to_csv()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Parity check: closed-form payments and schedules must match the month-by-month simulation
+"""
+
+import numpy as np
+from mortgage_refinance_calculator import MortgageRefinanceCalculator, monthly_payments, PAYOFF_TOLERANCE
+
+# (principal, annual_rate, term_months, payment_scale, extra_monthly, extra_one_time)
+CASES = [
+    (450000, 0.0675, 300, 1.0, 0.0, 0.0),
+    (450000, 0.0625, 360, 1.0, 200.0, 10000.0),
+    (300000, 0.04, 360, 1.3, 0.0, 0.0),
+    (210000, 0.0525, 180, 1.0, 0.0, 5000.0),
+    (200000, 0.0, 120, 1.0, 0.0, 0.0),
+    (95000, 0.0725, 120, 1.0, 150.0, 0.0),
+    (1000, 0.05, 12, 4.0, 0.0, 0.0),
+    (100000, 0.12, 360, 0.5, 0.0, 0.0)  # Payment below interest: stops after month 1000
+]
+
+def loop_monthly_payment(principal, annual_rate, months):
+    """Reference: the textbook formula with explicit powers"""
+    if annual_rate == 0:
+        return principal / months
+    monthly_rate = annual_rate / 12
+    return principal * (monthly_rate * (1 + monthly_rate)**months) / ((1 + monthly_rate)**months - 1)
+
+def loop_schedule(principal, annual_rate, base_monthly_payment, extra_monthly=0.0, extra_one_time=0.0,
+                  max_months=3600):
+    """Reference: the original month-by-month paydown simulation"""
+    schedule = []
+    balance = principal
+    total_interest = 0.0
+    months_elapsed = 0
+    monthly_rate = annual_rate / 12 if annual_rate > 0 else 0
+
+    while balance > 0 and months_elapsed < max_months:
+        months_elapsed += 1
+        current_extra = extra_monthly + (extra_one_time if months_elapsed == 1 else 0.0)
+        interest_payment = balance * monthly_rate
+        total_payment = base_monthly_payment + current_extra
+        principal_payment = total_payment - interest_payment
+        if principal_payment >= balance:
+            principal_payment = balance
+            total_payment = balance + interest_payment
+        balance -= principal_payment
+        total_interest += interest_payment
+        if principal_payment <= 0 and current_extra <= 0:
+            if months_elapsed > 1000:
+                break
+        schedule.append((months_elapsed, balance, interest_payment, principal_payment, total_payment))
+
+    return {
+        "schedule": schedule,
+        "months_to_payoff": months_elapsed,
+        "total_interest": total_interest,
+        "total_payments": principal + total_interest
+    }
+
+def test_monthly_payment_matches_formula():
+    """Scalar and vectorized payments equal the textbook formula"""
+    calculator = MortgageRefinanceCalculator()
+    for principal, annual_rate, months, *_ in CASES:
+        expected = loop_monthly_payment(principal, annual_rate, months)
+        assert np.isclose(calculator.calculate_monthly_payment(principal, annual_rate, months), expected)
+
+    rates = np.array([case[1] for case in CASES])
+    terms = np.array([case[2] for case in CASES])
+    expected = [loop_monthly_payment(450000, rate, term) for rate, term in zip(rates.tolist(), terms.tolist())]
+    assert np.allclose(monthly_payments(450000, rates, terms), expected)
+
+def test_schedule_matches_simulation():
+    """Closed-form schedule equals the simulated one, month by month"""
+    calculator = MortgageRefinanceCalculator()
+    for principal, annual_rate, months, scale, extra_monthly, extra_one_time in CASES:
+        payment = loop_monthly_payment(principal, annual_rate, months) * scale
+        expected = loop_schedule(principal, annual_rate, payment, extra_monthly, extra_one_time)
+        actual = calculator.generate_amortization_schedule(principal, annual_rate, payment,
+                                                           extra_monthly, extra_one_time)
+        rows = np.array(expected["schedule"])
+        schedule = actual["schedule"]
+
+        # The simulation can leave a sub-cent remainder that it pays off in extra "dust" months;
+        # the closed form folds that into the final payment instead
+        dust = rows[len(schedule):]
+        assert len(rows) >= len(schedule), (principal, annual_rate)
+        assert np.all(dust[:, 4] < PAYOFF_TOLERANCE), (principal, annual_rate)
+        assert actual["months_to_payoff"] == expected["months_to_payoff"] - len(dust), (principal, annual_rate)
+
+        rows = rows[:len(schedule)]
+        assert np.array_equal(schedule['month'], rows[:, 0])
+        for column, field in enumerate(('balance', 'interest_paid', 'principal_paid', 'total_payment'), 1):
+            assert np.allclose(schedule[field], rows[:, column], rtol=1e-9, atol=1e-6), (field, principal, annual_rate)
+        assert np.isclose(actual["total_interest"], expected["total_interest"], rtol=1e-9, atol=1e-6)
+        assert np.isclose(actual["total_payments"], expected["total_payments"], rtol=1e-9, atol=1e-6)
+
+if __name__ == "__main__":
+    test_monthly_payment_matches_formula()
+    test_schedule_matches_simulation()
+    print("✅ Closed-form amortization matches the month-by-month simulation")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Parity check: the lxml scrapers must extract what the original BeautifulSoup scrapers did
+
+Expected values were recorded by running the original scrapers on the same pages.
+"""
+
+from mortgage_market_data import MortgageMarketDataScraper
+
+BANKRATE_PAGE = b"""<html><body>
+<table>
+<tr><td>30-year fixed</td><td>6.875%</td></tr>
+<tr><td>15-year fixed</td><td>6.125%</td></tr>
+<tr><td>Jumbo loans</td><td>7.050%</td></tr>
+</table>
+</body></html>"""
+
+MND_PAGE = b"""<html><body>
+<p>Today: 6.85% 30-year fixed and 6.10% 15 year fixed.</p>
+<p>Last week the average was 6.900% thirty-year.</p>
+</body></html>"""
+
+FREDDIE_PAGE = b"""<html><body>
+<p>30-yr FRM <b>6.72%</b></p>
+<p>15-yr FRM <b>5.94%</b></p>
+</body></html>"""
+
+MBA_PAGES = {
+    'up': b"<html><body><p>Economists say rates will rise into next year.</p></body></html>",
+    'down': b"<html><body><p>We expect lower rates by spring.</p></body></html>",
+    'up_over_down': b"<html><body><p>Some expect lower rates; others say rates will rise.</p></body></html>",
+    'stable': b"<html><body><p>No change in the outlook.</p></body></html>"
+}
+
+FANNIE_PAGES = {
+    'up': b"<html><body><div><p>Mortgage rates should rise slowly.</p></div></body></html>",
+    'down': b"<html><body><p>Mortgage rates are expected to decrease.</p></body></html>",
+    'stable': b"<html><body><p>Mortgage demand holds steady.</p><p>Home prices move higher.</p></body></html>"
+}
+
+class PageResponse:
+    """Streaming response serving a fixed page"""
+    status_code = 200
+    headers = {}
+
+    def __init__(self, page: bytes):
+        self.page = page
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.page), chunk_size):
+            yield self.page[start:start + chunk_size]
+
+class PageSession:
+    """Stand-in for requests.Session that serves one page for every URL"""
+
+    def __init__(self, page: bytes):
+        self.page = page
+
+    def get(self, url, **kwargs):
+        return PageResponse(self.page)
+
+def scraper_for(page: bytes) -> MortgageMarketDataScraper:
+    """Scraper whose calling thread fetches the given page, with the disk cache off"""
+    scraper = MortgageMarketDataScraper()
+    scraper.http_cache_dir = None
+    scraper._local.session = PageSession(page)
+    return scraper
+
+def quotes(rates):
+    return [(r.rate_type, round(r.rate * 100, 3)) for r in rates]
+
+def test_rate_scrapers_match_original():
+    """Rate type and value extracted from each source page"""
+    assert quotes(scraper_for(BANKRATE_PAGE).get_bankrate_rates()) == [
+        ('30-year', 6.875), ('15-year', 6.125), ('30-year-jumbo', 7.05)
+    ]
+    # All 30-year quotes are listed before the 15-year ones
+    assert quotes(scraper_for(MND_PAGE).get_mortgage_news_daily_rates()) == [
+        ('30-year', 6.85), ('30-year', 6.9), ('15-year', 6.1)
+    ]
+    assert quotes(scraper_for(FREDDIE_PAGE).get_freddie_mac_rates()) == [
+        ('30-year', 6.72), ('30-year', 5.94)
+    ]
+
+def test_forecast_scrapers_match_original():
+    """Forecast direction read from each source page"""
+    for expected, page in MBA_PAGES.items():
+        direction = scraper_for(page)._scrape_mba_forecast()[0].direction
+        assert direction == expected.split('_')[0], expected
+    for expected, page in FANNIE_PAGES.items():
+        assert scraper_for(page)._scrape_fannie_mae_forecast()[0].direction == expected, expected
+
+if __name__ == "__main__":
+    test_rate_scrapers_match_original()
+    test_forecast_scrapers_match_original()
+    print("✅ Market data scrapers match the original parsers")
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Consistency check: portfolio metrics must match analyze_refinance loan by loan
+"""
+
+import numpy as np
+from mortgage_refinance_calculator import (
+    MortgageRefinanceCalculator, MortgageDetails, MortgageDetailsBatch, RefinanceOptions
+)
+
+LOANS = [
+    MortgageDetails(rate=0.0675, balance=450000, payment=3200, remaining_months=300),
+    MortgageDetails(rate=0.0525, balance=210000, payment=1350, remaining_months=240,
+                    extra_monthly_payment=200, extra_one_time_payment=5000),
+    MortgageDetails(rate=0.0725, balance=95000, payment=900, remaining_months=120)
+]
+
+OPTIONS = [
+    RefinanceOptions(new_rate=0.0625, new_term_months=360, closing_costs=8000),
+    RefinanceOptions(new_rate=0.0625, new_term_months=360, closing_costs=8000, buydown_points=1.0),
+    RefinanceOptions(new_rate=0.0575, new_term_months=180, closing_costs=6000),
+    RefinanceOptions(new_rate=0.0, new_term_months=240, closing_costs=3000),
+    RefinanceOptions(new_rate=0.09, new_term_months=360, closing_costs=3000)
+]
+
+def test_portfolio_matches_analyze_refinance():
+    """Every shared metric of analyze_portfolio equals the single-loan analysis"""
+    calculator = MortgageRefinanceCalculator()
+    portfolio = calculator.analyze_portfolio(MortgageDetailsBatch.from_mortgages(LOANS), OPTIONS)
+
+    for i, loan in enumerate(LOANS):
+        for j, option in enumerate(OPTIONS):
+            single = calculator.analyze_refinance(loan, option)
+
+            for key in ('buydown_cost', 'total_upfront_cost', 'new_monthly_payment', 'monthly_savings'):
+                assert np.isclose(portfolio[key][i, j], single[key]), (key, i, j)
+
+            rate_reduction = (single['current_rate'] - single['effective_rate_after_buydown']) / 100
+            assert np.isclose(portfolio['rate_reduction'][i, j], rate_reduction), ('rate_reduction', i, j)
+
+            # analyze_refinance reports a break-even that never arrives as 'Never'
+            for key in ('break_even_months', 'break_even_years'):
+                expected = np.inf if single[key] == 'Never' else single[key]
+                assert np.isclose(portfolio[key][i, j], expected), (key, i, j)
+
+if __name__ == "__main__":
+    test_portfolio_matches_analyze_refinance()
+    print("✅ Portfolio metrics match analyze_refinance")
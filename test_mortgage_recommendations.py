@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Parity check: vectorized recommendations must match the original per-scenario rules
+"""
+
+import itertools
+import numpy as np
+import pandas as pd
+from mortgage_refinance_calculator import MortgageRefinanceCalculator, RECOMMENDATIONS
+from mortgage_enhanced_calculator import EnhancedMortgageCalculator
+
+# Grid points sit on and either side of every threshold in the rules
+BREAK_EVEN_YEARS = [0.0, 1.0, 1.5, 1.6, 2.0, 2.1, 4.9, 5.0, 5.1, 9.9, 10.0, 10.5, 40.0, float('inf')]
+MONTHLY_SAVINGS = [-100.0, 0.0, 0.01, 250.0]
+SAVINGS_5_YEARS = [-5000.0, 0.0, 12000.0]
+TIMING_RECOMMENDATIONS = ['refi_now', 'wait_3_months', 'wait_6_months', 'uncertain']
+
+def scalar_recommendation(break_even_years, monthly_savings, savings_5_years):
+    """Reference: the original per-scenario recommendation rules"""
+    if monthly_savings <= 0:
+        return "NOT RECOMMENDED - Higher monthly payment"
+    elif break_even_years == float('inf'):
+        return "NOT RECOMMENDED - Never breaks even"
+    elif break_even_years <= 2:
+        return "HIGHLY RECOMMENDED - Quick break-even"
+    elif break_even_years <= 5 and savings_5_years > 0:
+        return "RECOMMENDED - Reasonable break-even period"
+    elif break_even_years <= 10:
+        return "CONSIDER - Long break-even but potential savings"
+    else:
+        return "NOT RECOMMENDED - Break-even too long"
+
+def scalar_combined_recommendation(financial_rec, timing_rec, break_even):
+    """Reference: the original per-row financial + market timing rules"""
+    if 'NOT RECOMMENDED' in financial_rec:
+        return financial_rec + " + Market timing irrelevant"
+
+    if timing_rec == 'refi_now':
+        if 'HIGHLY RECOMMENDED' in financial_rec:
+            return "🔥 EXCELLENT OPPORTUNITY - Great financials + Perfect timing"
+        else:
+            return "⭐ GOOD OPPORTUNITY - " + financial_rec + " + Good market timing"
+    elif timing_rec == 'wait_3_months':
+        if break_even <= 2:
+            return "⚡ REFI NOW - Benefits too good despite timing concerns"
+        else:
+            return "⏳ CONSIDER WAITING - " + financial_rec + " but rates may improve"
+    elif timing_rec == 'wait_6_months':
+        if break_even <= 1.5:
+            return "⚡ REFI NOW - Exceptional benefits outweigh timing"
+        else:
+            return "⏳ WAIT FOR BETTER RATES - Market conditions suggest patience"
+    else:
+        return "🤔 MIXED SIGNALS - " + financial_rec + " but uncertain market"
+
+def test_recommendations_match_scalar_rules():
+    """np.select ladder gives the same recommendation as the if/elif rules for every grid point"""
+    grid = list(itertools.product(BREAK_EVEN_YEARS, MONTHLY_SAVINGS, SAVINGS_5_YEARS))
+    break_even, savings, savings_5 = (np.array(column) for column in zip(*grid))
+
+    actual = MortgageRefinanceCalculator()._generate_recommendations_vectorized(break_even, savings, savings_5)
+    expected = [scalar_recommendation(*point) for point in grid]
+    assert actual.tolist() == expected
+
+def test_combined_recommendations_match_scalar_rules():
+    """Market timing combination matches the per-row rules for every financial recommendation"""
+    grid = list(itertools.product(RECOMMENDATIONS.tolist(), BREAK_EVEN_YEARS[:-1] + [999.0]))
+    financial_recs = pd.Series([rec for rec, _ in grid])
+    break_even = np.array([years for _, years in grid])
+
+    calculator = EnhancedMortgageCalculator()
+    for timing_rec in TIMING_RECOMMENDATIONS:
+        actual = calculator._combine_recommendations_vectorized(financial_recs, timing_rec, break_even)
+        expected = [scalar_combined_recommendation(rec, timing_rec, years) for rec, years in grid]
+        assert actual.tolist() == expected, timing_rec
+
+if __name__ == "__main__":
+    test_recommendations_match_scalar_rules()
+    test_combined_recommendations_match_scalar_rules()
+    print("✅ Vectorized recommendations match the per-scenario rules")